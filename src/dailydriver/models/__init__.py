@@ -12,6 +12,7 @@ from dailydriver.models.profile import (
     MacKeyboardConfig,
     Profile,
     XKBOptions,
+    normalize_accelerator,
 )
 from dailydriver.models.shortcut import (
     KeyBinding,
@@ -33,4 +34,5 @@ __all__ = [
     "Shortcut",
     "ShortcutCategory",
     "XKBOptions",
+    "normalize_accelerator",
 ]
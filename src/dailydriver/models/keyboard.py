@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 """Keyboard layout and hardware models."""
 
+import math
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -67,17 +68,37 @@ class KeyboardLayout:
     width: float = 0.0
     height: float = 0.0
 
-    def get_key_at(self, x: float, y: float) -> Key | None:
-        """Find key at given position (in key units)."""
+    # 1u grid cell -> keys overlapping it, built on first hit test
+    _grid: dict[tuple[int, int], list[Key]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _build_grid(self) -> dict[tuple[int, int], list[Key]]:
+        """Bucket keys by every 1u grid cell their rectangle overlaps."""
+        grid: dict[tuple[int, int], list[Key]] = {}
         for key in self.keys:
+            for col in range(math.floor(key.x), math.ceil(key.x + key.width)):
+                for row in range(math.floor(key.y), math.ceil(key.y + key.height)):
+                    grid.setdefault((col, row), []).append(key)
+        return grid
+
+    def get_key_at(self, x: float, y: float) -> Key | None:
+        """Find key at given position (in key units).
+
+        Only keys sharing the position's grid cell are tested, so ``keys``
+        must not change after the first lookup.
+        """
+        if self._grid is None:
+            self._grid = self._build_grid()
+        for key in self._grid.get((math.floor(x), math.floor(y)), ()):
             if key.x <= x < key.x + key.width and key.y <= y < key.y + key.height:
                 return key
         return None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetectedKeyboard:
-    """A detected physical keyboard."""
+    """A detected physical keyboard (immutable snapshot of one scan)."""
 
     name: str
     path: str  # /dev/input/event* path
@@ -4,6 +4,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Self
 
@@ -15,6 +16,18 @@ except ImportError:
 import tomli_w
 
 
+@lru_cache(maxsize=1024)
+def normalize_accelerator(accel: str) -> str:
+    """Normalize accelerator string through GTK parsing.
+
+    Presets share most of their accelerators, so results are memoized.
+    """
+    from dailydriver.models.shortcut import KeyBinding
+
+    binding = KeyBinding.from_accelerator(accel)
+    return binding.to_accelerator() if binding else accel
+
+
 class FnMode(Enum):
     """Function key mode for hid-apple."""
 
@@ -76,6 +89,11 @@ class Profile:
     # Custom metadata
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # Normalized shortcuts, built lazily by normalized_shortcuts()
+    _normalized: dict[str, frozenset[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def from_toml(cls, path: Path) -> Self:
         """Load profile from TOML file."""
@@ -189,3 +207,18 @@ class Profile:
         """Set shortcut binding(s)."""
         storage_key = self.get_shortcut_key(schema, key)
         self.shortcuts[storage_key] = accelerators
+        self._normalized = None
+
+    def normalized_shortcuts(self) -> dict[str, frozenset[str]]:
+        """Get shortcuts with accelerators normalized for comparison.
+
+        GTK reorders modifiers, so profile accelerators are round-tripped through
+        KeyBinding once and cached. set_shortcut() invalidates the cache; callers
+        mutating ``shortcuts`` directly must not rely on it.
+        """
+        if self._normalized is None:
+            self._normalized = {
+                storage_key: frozenset(normalize_accelerator(a) for a in accels)
+                for storage_key, accels in self.shortcuts.items()
+            }
+        return self._normalized
@@ -52,6 +52,20 @@ class ShortcutsBackend(ABC):
         """
         ...
 
+    def save_shortcuts_batch(self, shortcuts: list[Shortcut]) -> list[Shortcut]:
+        """Save several shortcut bindings at once.
+
+        Backends that can coalesce writes should override this; the default
+        saves each shortcut individually.
+
+        Args:
+            shortcuts: The shortcuts with updated bindings to save.
+
+        Returns:
+            The shortcuts that were saved successfully.
+        """
+        return [shortcut for shortcut in shortcuts if self.save_shortcut(shortcut)]
+
     @abstractmethod
     def reset_shortcut(self, shortcut: Shortcut) -> bool:
         """Reset a shortcut to its default binding.
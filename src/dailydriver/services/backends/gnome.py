@@ -11,6 +11,17 @@ from gi.repository import Gio, GLib
 from dailydriver.models import KeyBinding, Shortcut, ShortcutCategory
 from dailydriver.services.backends.base import ShortcutsBackend
 
+# File managers as (name, launch command); the name is both the binary and the
+# substring matched against the default inode/directory desktop file
+_FILE_MANAGERS = (
+    ("nautilus", "nautilus --new-window"),
+    ("thunar", "thunar"),
+    ("dolphin", "dolphin --new-window"),
+    ("nemo", "nemo --new-window"),
+    ("pcmanfm", "pcmanfm --new-win"),
+    ("caja", "caja --new-window"),
+)
+
 # Known GSettings schemas containing shortcuts
 SHORTCUT_SCHEMAS = [
     # Window Manager
@@ -459,7 +470,11 @@ class GnomeShortcutsBackend(ShortcutsBackend):
 
     def __init__(self) -> None:
         self._settings_cache: dict[str, Gio.Settings] = {}
+        # Schema lookups by ID, including misses (None) for schemas that aren't installed
+        self._schema_cache: dict[str, Gio.SettingsSchema | None] = {}
         self._schema_source = Gio.SettingsSchemaSource.get_default()
+        # Detection helpers that failed to exec (e.g. no flatpak installed)
+        self._missing_tools: set[str] = set()
 
     def _get_settings(self, schema_id: str, path: str | None = None) -> Gio.Settings | None:
         """Get or create GSettings for a schema, optionally with a path for relocatable schemas."""
@@ -467,7 +482,7 @@ class GnomeShortcutsBackend(ShortcutsBackend):
         if cache_key in self._settings_cache:
             return self._settings_cache[cache_key]
 
-        schema = self._schema_source.lookup(schema_id, True)
+        schema = self._get_schema(schema_id)
         if not schema:
             return None
 
@@ -480,6 +495,15 @@ class GnomeShortcutsBackend(ShortcutsBackend):
         self._settings_cache[cache_key] = settings
         return settings
 
+    def _get_schema(self, schema_id: str) -> Gio.SettingsSchema | None:
+        """Look up a schema once; the installed schema set doesn't change at runtime."""
+        try:
+            return self._schema_cache[schema_id]
+        except KeyError:
+            schema = self._schema_source.lookup(schema_id, True)
+            self._schema_cache[schema_id] = schema
+            return schema
+
     def _is_shortcut_key(self, schema: Gio.SettingsSchema, key: str) -> bool:
         """Check if a key is a shortcut binding."""
         key_obj = schema.get_key(key)
@@ -578,7 +602,7 @@ class GnomeShortcutsBackend(ShortcutsBackend):
             if not settings:
                 continue
 
-            schema = self._schema_source.lookup(schema_id, True)
+            schema = self._get_schema(schema_id)
             if not schema:
                 continue
 
@@ -676,13 +700,58 @@ class GnomeShortcutsBackend(ShortcutsBackend):
         if not settings:
             return False
 
-        schema = self._schema_source.lookup(shortcut.schema, True)
+        schema = self._get_schema(shortcut.schema)
         if not schema:
             return False
 
+        value = self._binding_variant(schema, shortcut)
+        if value is None:
+            return False
+
+        settings.set_value(shortcut.key, value)
+        return True
+
+    def save_shortcuts_batch(self, shortcuts: list[Shortcut]) -> list[Shortcut]:
+        """Save several shortcuts, committing each schema's writes in one transaction."""
+        saved: list[Shortcut] = []
+        by_schema: dict[str, list[Shortcut]] = {}
+
+        for shortcut in shortcuts:
+            if shortcut.schema == "custom":
+                # Each custom binding lives at its own relocatable path
+                if self.save_shortcut(shortcut):
+                    saved.append(shortcut)
+            else:
+                by_schema.setdefault(shortcut.schema, []).append(shortcut)
+
+        for schema_id, schema_shortcuts in by_schema.items():
+            schema = self._get_schema(schema_id)
+            if not schema:
+                continue
+
+            # delay() holds writes until apply(), so dconf sees one change set.
+            # Delay-apply mode can't be left again, so use a throwaway Settings
+            # object rather than the shared one in _settings_cache.
+            settings = Gio.Settings.new_full(schema, None, None)
+            settings.delay()
+            try:
+                for shortcut in schema_shortcuts:
+                    value = self._binding_variant(schema, shortcut)
+                    if value is not None:
+                        settings.set_value(shortcut.key, value)
+                        saved.append(shortcut)
+            finally:
+                settings.apply()
+
+        return saved
+
+    def _binding_variant(
+        self, schema: Gio.SettingsSchema, shortcut: Shortcut
+    ) -> GLib.Variant | None:
+        """Build the GSettings value for a shortcut's bindings, or None if unsupported."""
         key_obj = schema.get_key(shortcut.key)
         if not key_obj:
-            return False
+            return None
 
         variant_type = key_obj.get_value_type()
         type_string = variant_type.dup_string()
@@ -691,19 +760,13 @@ class GnomeShortcutsBackend(ShortcutsBackend):
 
         if type_string == "as":
             if not accelerators:
-                value = GLib.Variant("as", ["disabled"])
-            else:
-                value = GLib.Variant("as", accelerators)
-        elif type_string == "s":
+                return GLib.Variant("as", ["disabled"])
+            return GLib.Variant("as", accelerators)
+        if type_string == "s":
             if not accelerators:
-                value = GLib.Variant("s", "disabled")
-            else:
-                value = GLib.Variant("s", accelerators[0])
-        else:
-            return False
-
-        settings.set_value(shortcut.key, value)
-        return True
+                return GLib.Variant("s", "disabled")
+            return GLib.Variant("s", accelerators[0])
+        return None
 
     def find_conflicts(self, binding: KeyBinding, exclude_id: str | None = None) -> list[Shortcut]:
         """Find shortcuts that conflict with a binding."""
@@ -788,12 +851,10 @@ class GnomeShortcutsBackend(ShortcutsBackend):
 
         new_path = f"{self.CUSTOM_PATH_PREFIX}/custom{num}/"
 
-        binding_settings = self._get_settings(self.CUSTOM_BINDING_SCHEMA, new_path)
-        if not binding_settings:
+        if not self._set_custom_strings(
+            new_path, {"name": name, "command": command, "binding": binding}
+        ):
             return None
-        binding_settings.set_string("name", name)
-        binding_settings.set_string("command", command)
-        binding_settings.set_string("binding", binding)
 
         paths.append(new_path)
         settings.set_strv("custom-keybindings", paths)
@@ -808,17 +869,36 @@ class GnomeShortcutsBackend(ShortcutsBackend):
         binding: str | None = None,
     ) -> bool:
         """Update an existing custom keybinding."""
-        binding_settings = self._get_settings(self.CUSTOM_BINDING_SCHEMA, path)
-        if not binding_settings:
-            return False
+        values = {
+            k: v
+            for k, v in (("name", name), ("command", command), ("binding", binding))
+            if v is not None
+        }
+        return self._set_custom_strings(path, values)
+
+    def _set_custom_strings(self, path: str, values: dict[str, str]) -> bool:
+        """Write string keys of the custom keybinding at path as one change set."""
+        if len(values) <= 1:
+            binding_settings = self._get_settings(self.CUSTOM_BINDING_SCHEMA, path)
+            if not binding_settings:
+                return False
+            for key, value in values.items():
+                binding_settings.set_string(key, value)
+            return True
 
-        if name is not None:
-            binding_settings.set_string("name", name)
-        if command is not None:
-            binding_settings.set_string("command", command)
-        if binding is not None:
-            binding_settings.set_string("binding", binding)
+        schema = self._get_schema(self.CUSTOM_BINDING_SCHEMA)
+        if not schema:
+            return False
 
+        # Same delay()/apply() pattern as save_shortcuts_batch, on a private
+        # Settings object so the cached one never enters delay-apply mode
+        binding_settings = Gio.Settings.new_full(schema, None, path)
+        binding_settings.delay()
+        try:
+            for key, value in values.items():
+                binding_settings.set_string(key, value)
+        finally:
+            binding_settings.apply()
         return True
 
     def delete_custom_keybinding(self, path: str) -> bool:
@@ -870,42 +950,32 @@ class GnomeShortcutsBackend(ShortcutsBackend):
 
         return None
 
-    def detect_file_manager(self) -> str | None:
-        """Detect the default file manager."""
-        try:
-            result = subprocess.run(
-                ["xdg-mime", "query", "default", "inode/directory"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                desktop_file = result.stdout.strip()
-                if "nautilus" in desktop_file:
-                    return "nautilus --new-window"
-                elif "thunar" in desktop_file:
-                    return "thunar"
-                elif "dolphin" in desktop_file:
-                    return "dolphin --new-window"
-                elif "nemo" in desktop_file:
-                    return "nemo --new-window"
-                elif "pcmanfm" in desktop_file:
-                    return "pcmanfm --new-win"
-                elif "caja" in desktop_file:
-                    return "caja --new-window"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+    def _run_detection(self, *argv: str) -> str | None:
+        """Run an app-detection command, returning stdout on success or None."""
+        # A helper that isn't installed won't appear mid-session; don't retry the exec
+        if argv[0] in self._missing_tools:
+            return None
 
-        file_managers = [
-            ("nautilus", "nautilus --new-window"),
-            ("thunar", "thunar"),
-            ("dolphin", "dolphin --new-window"),
-            ("nemo", "nemo --new-window"),
-            ("pcmanfm", "pcmanfm --new-win"),
-            ("caja", "caja --new-window"),
-        ]
+        try:
+            result = subprocess.run(list(argv), capture_output=True, text=True, timeout=5)
+        except FileNotFoundError:
+            self._missing_tools.add(argv[0])
+            return None
+        except subprocess.TimeoutExpired:
+            return None
+        return result.stdout if result.returncode == 0 else None
 
-        for binary, command in file_managers:
+    def detect_file_manager(self) -> str | None:
+        """Detect the default file manager."""
+        output = self._run_detection("xdg-mime", "query", "default", "inode/directory")
+        if output is not None:
+            # Desktop file IDs are mixed case (org.gnome.Nautilus.desktop); fold once
+            desktop_file = output.strip().lower()
+            for name, command in _FILE_MANAGERS:
+                if name in desktop_file:
+                    return command
+
+        for binary, command in _FILE_MANAGERS:
             if shutil.which(binary):
                 return command
 
@@ -913,33 +983,25 @@ class GnomeShortcutsBackend(ShortcutsBackend):
 
     def detect_browser(self) -> str | None:
         """Detect the default browser."""
-        try:
-            result = subprocess.run(
-                ["xdg-settings", "get", "default-web-browser"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                desktop_file = result.stdout.strip()
-                if "firefox" in desktop_file:
-                    return "firefox --new-window"
-                elif "chrome" in desktop_file or "chromium" in desktop_file:
-                    return (
-                        "google-chrome --new-window"
-                        if shutil.which("google-chrome")
-                        else "chromium --new-window"
-                    )
-                elif "brave" in desktop_file:
-                    return "brave --new-window"
-                elif "vivaldi" in desktop_file:
-                    return "vivaldi --new-window"
-                elif "epiphany" in desktop_file or "gnome-web" in desktop_file:
-                    return "epiphany --new-window"
-                elif "zen" in desktop_file:
-                    return "zen-browser --new-window"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        output = self._run_detection("xdg-settings", "get", "default-web-browser")
+        if output is not None:
+            desktop_file = output.strip().lower()
+            if "firefox" in desktop_file:
+                return "firefox --new-window"
+            elif "chrome" in desktop_file or "chromium" in desktop_file:
+                return (
+                    "google-chrome --new-window"
+                    if shutil.which("google-chrome")
+                    else "chromium --new-window"
+                )
+            elif "brave" in desktop_file:
+                return "brave --new-window"
+            elif "vivaldi" in desktop_file:
+                return "vivaldi --new-window"
+            elif "epiphany" in desktop_file or "gnome-web" in desktop_file:
+                return "epiphany --new-window"
+            elif "zen" in desktop_file:
+                return "zen-browser --new-window"
 
         browsers = [
             ("firefox", "firefox --new-window"),
@@ -961,30 +1023,14 @@ class GnomeShortcutsBackend(ShortcutsBackend):
 
     def detect_music_player(self) -> str | None:
         """Detect installed music player."""
-        try:
-            result = subprocess.run(
-                ["flatpak", "info", "com.spotify.Client"],
-                capture_output=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return "flatpak run com.spotify.Client"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        if self._run_detection("flatpak", "info", "com.spotify.Client") is not None:
+            return "flatpak run com.spotify.Client"
 
         if shutil.which("spotify"):
             return "spotify"
 
-        try:
-            result = subprocess.run(
-                ["flatpak", "info", "com.mastermindzh.tidal-hifi"],
-                capture_output=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return "flatpak run com.mastermindzh.tidal-hifi"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        if self._run_detection("flatpak", "info", "com.mastermindzh.tidal-hifi") is not None:
+            return "flatpak run com.mastermindzh.tidal-hifi"
 
         players = [
             ("rhythmbox", "rhythmbox"),
@@ -1053,16 +1099,8 @@ class GnomeShortcutsBackend(ShortcutsBackend):
 
     def detect_dailydriver(self) -> str | None:
         """Detect DailyDriver installation."""
-        try:
-            result = subprocess.run(
-                ["flatpak", "info", "io.github.gregfelice.DailyDriver"],
-                capture_output=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return "flatpak run io.github.gregfelice.DailyDriver --cheat-sheet"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        if self._run_detection("flatpak", "info", "io.github.gregfelice.DailyDriver") is not None:
+            return "flatpak run io.github.gregfelice.DailyDriver --cheat-sheet"
 
         if shutil.which("dailydriver"):
             return "dailydriver --cheat-sheet"
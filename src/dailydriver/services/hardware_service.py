@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 """Service for detecting and managing keyboard hardware."""
 
+import os
+import struct
 from collections.abc import Generator
 from pathlib import Path
 
@@ -42,62 +44,149 @@ APPLE_KEYBOARD_PRODUCTS = {
 # Known Apple vendor IDs
 APPLE_VENDOR_IDS = {0x05AC}
 
+# BUS_BLUETOOTH from linux/input.h, as reported in device/id/bustype
+_BUS_BLUETOOTH = 0x05
+
+# sysfs prints capability bitmaps as space-separated native longs, most significant first
+_BITS_PER_LONG = struct.calcsize("l") * 8
+
+# Linux input keycodes (linux/input-event-codes.h)
+# KEY_KP7 (71) through KEY_KPDOT (83): the numeric keypad block
+_KEY_KP_MASK = sum(1 << code for code in range(71, 84))
+# KEY_MUTE, KEY_VOLUMEDOWN, KEY_VOLUMEUP, KEY_NEXTSONG, KEY_PLAYPAUSE, KEY_PREVIOUSSONG
+_KEY_MEDIA_MASK = sum(1 << code for code in (113, 114, 115, 163, 164, 165))
+
+
+def _read_sysfs(path: str) -> str | None:
+    """Read a sysfs attribute, or None if it is missing or unreadable.
+
+    A single open() both probes and reads, so no separate exists() stat is needed.
+    """
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _parse_key_bitmap(caps: str) -> int:
+    """Combine a sysfs capability bitmap into a single integer."""
+    bits = 0
+    for word in caps.split():
+        bits = (bits << _BITS_PER_LONG) | int(word, 16)
+    return bits
+
 
 class HardwareService:
     """Service for detecting keyboard hardware via evdev/sysfs."""
 
     def __init__(self) -> None:
         self._input_path = Path("/sys/class/input")
+        # Results of the last scan, keyed by /dev/input/event* path
+        self._keyboards: dict[str, DetectedKeyboard] | None = None
+        self._mac_keyboards: list[DetectedKeyboard] = []
 
     def list_keyboards(self) -> Generator[DetectedKeyboard, None, None]:
-        """List all detected keyboards."""
-        if not self._input_path.exists():
-            return
-
-        for event_dir in sorted(self._input_path.glob("event*")):
-            device = self._parse_device(event_dir)
-            if device and self._is_keyboard(event_dir):
-                yield device
-
-    def _parse_device(self, event_dir: Path) -> DetectedKeyboard | None:
-        """Parse device information from sysfs."""
-        device_dir = event_dir / "device"
-        if not device_dir.exists():
-            return None
+        """List all detected keyboards.
 
-        # Get device name
-        name_file = device_dir / "name"
-        if not name_file.exists():
-            return None
+        Like the other lookups, this answers from the last scan, scanning only if
+        there is none yet; call scan() or invalidate() on hotplug.
+        """
+        keyboards = self._keyboards if self._keyboards is not None else self.scan()
+        yield from keyboards.values()
+
+    def scan(self) -> dict[str, DetectedKeyboard]:
+        """Rescan sysfs and return detected keyboards keyed by device path."""
+        keyboards: dict[str, DetectedKeyboard] = {}
+        mac_keyboards: list[DetectedKeyboard] = []
 
+        # scandir avoids a Path allocation and fnmatch per sysfs entry
         try:
-            name = name_file.read_text().strip()
-        except (OSError, PermissionError):
+            with os.scandir(self._input_path) as it:
+                entries = sorted(
+                    (e for e in it if e.name.startswith("event")), key=lambda e: e.name
+                )
+        except OSError:
+            entries = []
+
+        for entry in entries:
+            device = self._parse_device(entry.path)
+            if device:
+                keyboards[device.path] = device
+                if device.is_mac:
+                    mac_keyboards.append(device)
+
+        self._keyboards = keyboards
+        self._mac_keyboards = mac_keyboards
+        return keyboards
+
+    def invalidate(self) -> None:
+        """Forget the last scan so the next lookup rescans sysfs (e.g. after hotplug)."""
+        self._keyboards = None
+        self._mac_keyboards = []
+
+    def get_keyboard_by_path(self, path: str) -> DetectedKeyboard | None:
+        """Get a detected keyboard by its /dev/input path.
+
+        Answers from the last scan, scanning only if there is none yet, so a
+        keyboard plugged in later is missed until scan() or invalidate() is called.
+        """
+        keyboards = self._keyboards if self._keyboards is not None else self.scan()
+        return keyboards.get(path)
+
+    def get_mac_keyboards(self) -> list[DetectedKeyboard]:
+        """Get detected Apple keyboards.
+
+        Like get_keyboard_by_path(), this uses the last scan; call scan() or
+        invalidate() on hotplug to pick up new devices.
+        """
+        if self._keyboards is None:
+            self.scan()
+        return list(self._mac_keyboards)
+
+    def _parse_device(self, event_dir: str) -> DetectedKeyboard | None:
+        """Parse device information from sysfs, or None if it isn't a keyboard.
+
+        The name and key bitmap are read once here and shared by the keyboard
+        filter and the capability checks.
+        """
+        device_dir = os.path.join(event_dir, "device")
+
+        # Get device name (a missing device dir or name file both read as None)
+        name = _read_sysfs(os.path.join(device_dir, "name"))
+        if name is None:
+            return None
+
+        key_bits = self._read_key_bitmap(device_dir)
+        if not self._is_keyboard(name, key_bits):
             return None
 
-        # Get vendor/product IDs
+        # Get vendor/product IDs and bus type
         vendor_id = 0
         product_id = 0
+        bustype: int | None = None
 
-        id_dir = device_dir / "id"
-        if id_dir.exists():
-            try:
-                vendor_file = id_dir / "vendor"
-                if vendor_file.exists():
-                    vendor_id = int(vendor_file.read_text().strip(), 16)
-
-                product_file = id_dir / "product"
-                if product_file.exists():
-                    product_id = int(product_file.read_text().strip(), 16)
-            except (OSError, ValueError):
-                pass
+        try:
+            vendor = _read_sysfs(os.path.join(device_dir, "id", "vendor"))
+            if vendor is not None:
+                vendor_id = int(vendor, 16)
+
+            product = _read_sysfs(os.path.join(device_dir, "id", "product"))
+            if product is not None:
+                product_id = int(product, 16)
+
+            bus = _read_sysfs(os.path.join(device_dir, "id", "bustype"))
+            if bus is not None:
+                bustype = int(bus, 16)
+        except ValueError:
+            pass
 
         # Determine device path
-        dev_path = f"/dev/input/{event_dir.name}"
+        dev_path = f"/dev/input/{os.path.basename(event_dir)}"
 
         # Detect device type
         is_mac = vendor_id in APPLE_VENDOR_IDS
-        is_bluetooth = "bluetooth" in name.lower() or self._is_bluetooth_device(device_dir)
+        is_bluetooth = "bluetooth" in name.lower() or self._is_bluetooth_device(device_dir, bustype)
         is_internal = "AT Translated" in name or "laptop" in name.lower()
 
         # Get brand info
@@ -109,9 +198,9 @@ class HardwareService:
             model_name = APPLE_KEYBOARD_PRODUCTS[product_id]
 
         # Detect capabilities
-        has_numpad = self._has_numpad(device_dir)
-        has_media_keys = self._has_media_keys(device_dir)
-        has_fn_key = self._has_fn_key(device_dir)
+        has_numpad = self._has_numpad(key_bits)
+        has_media_keys = self._has_media_keys(key_bits)
+        has_fn_key = self._has_fn_key(name)
 
         return DetectedKeyboard(
             name=name,
@@ -129,110 +218,68 @@ class HardwareService:
             has_fn_key=has_fn_key,
         )
 
-    def _is_keyboard(self, event_dir: Path) -> bool:
+    def _is_keyboard(self, name: str, key_bits: int) -> bool:
         """Check if device is a keyboard (has KEY capabilities, not a mouse/trackpad)."""
-        device_dir = event_dir / "device"
-
         # First check device name to filter out non-keyboards
-        name_file = device_dir / "name"
-        if name_file.exists():
-            try:
-                name = name_file.read_text().strip().lower()
-                # Exclude mice, trackpads, touchscreens, etc.
-                exclude_patterns = [
-                    "trackpad",
-                    "touchpad",
-                    "mouse",
-                    "trackball",
-                    "touchscreen",
-                    "touch screen",
-                    "tablet",
-                    "gamepad",
-                    "joystick",
-                    "controller",
-                    "power button",
-                    "sleep button",
-                    "lid switch",
-                    "video bus",
-                    "pc speaker",
-                    "gpio",
-                ]
-                if any(pattern in name for pattern in exclude_patterns):
-                    return False
-            except (OSError, PermissionError):
-                pass
-
-        caps_file = device_dir / "capabilities" / "key"
-        if not caps_file.exists():
+        name = name.lower()
+        # Exclude mice, trackpads, touchscreens, etc.
+        exclude_patterns = [
+            "trackpad",
+            "touchpad",
+            "mouse",
+            "trackball",
+            "touchscreen",
+            "touch screen",
+            "tablet",
+            "gamepad",
+            "joystick",
+            "controller",
+            "power button",
+            "sleep button",
+            "lid switch",
+            "video bus",
+            "pc speaker",
+            "gpio",
+        ]
+        if any(pattern in name for pattern in exclude_patterns):
             return False
 
-        try:
-            caps = caps_file.read_text().strip()
-            # A keyboard should have non-zero key capabilities
-            # and should have alphabetic keys (not just buttons)
-            # Real keyboards have extensive key capabilities
-            parts = caps.split()
-            if not parts:
-                return False
-            # Check that we have enough capability bits for a real keyboard
-            # Mice/trackpads have minimal key caps, keyboards have many
-            total_bits = sum(bin(int(p, 16)).count("1") for p in parts)
-            return total_bits > 20  # Real keyboards have 50+ keys mapped
-        except (OSError, ValueError):
-            return False
-
-    def _is_bluetooth_device(self, device_dir: Path) -> bool:
-        """Check if device is connected via Bluetooth."""
-        # Follow symlinks to check device path
-        try:
-            uevent_file = device_dir / "uevent"
-            if uevent_file.exists():
-                content = uevent_file.read_text()
-                return "bluetooth" in content.lower()
-        except (OSError, PermissionError):
-            pass
-        return False
-
-    def _has_numpad(self, device_dir: Path) -> bool:
-        """Check if keyboard has a numpad."""
-        # This is a heuristic based on key capabilities
-        # Numpad keys are typically KEY_KP0-KEY_KPDOT (71-83)
-        caps_file = device_dir / "capabilities" / "key"
-        if not caps_file.exists():
-            return False
-
-        try:
-            caps = caps_file.read_text().strip()
-            # Check if numpad range has bits set
-            # This is a simplified check
-            return len(caps) > 20  # Full keyboards have more capability bits
-        except (OSError, ValueError):
-            return False
+        # Mice/trackpads have minimal key caps, keyboards have many.
+        # Counting bits on the combined bitmap is a single C-level popcount.
+        return key_bits.bit_count() > 20  # Real keyboards have 50+ keys mapped
 
-    def _has_media_keys(self, device_dir: Path) -> bool:
-        """Check if keyboard has media keys."""
-        # Media keys are in the extended key range
-        caps_file = device_dir / "capabilities" / "key"
-        if not caps_file.exists():
-            return False
+    def _read_key_bitmap(self, device_dir: str) -> int:
+        """Read the KEY capability bitmap, or 0 if unavailable."""
+        caps = _read_sysfs(os.path.join(device_dir, "capabilities", "key"))
+        if caps is None:
+            return 0
 
         try:
-            caps = caps_file.read_text().strip()
-            # Check for extended key capabilities
-            parts = caps.split()
-            return len(parts) > 3  # Media keys require extended capability bits
-        except (OSError, ValueError):
-            return False
-
-    def _has_fn_key(self, device_dir: Path) -> bool:
+            return _parse_key_bitmap(caps)
+        except ValueError:
+            return 0
+
+    def _is_bluetooth_device(self, device_dir: str, bustype: int | None = None) -> bool:
+        """Check if device is connected via Bluetooth.
+
+        The bus type from id/bustype is authoritative; uevent is only parsed
+        when the kernel didn't expose it.
+        """
+        if bustype is not None:
+            return bustype == _BUS_BLUETOOTH
+        uevent = _read_sysfs(os.path.join(device_dir, "uevent"))
+        return uevent is not None and "bluetooth" in uevent.lower()
+
+    def _has_numpad(self, key_bits: int) -> bool:
+        """Check if keyboard has a numpad (all of KEY_KP7..KEY_KPDOT)."""
+        return key_bits & _KEY_KP_MASK == _KEY_KP_MASK
+
+    def _has_media_keys(self, key_bits: int) -> bool:
+        """Check if keyboard has media keys (volume or playback keys)."""
+        return bool(key_bits & _KEY_MEDIA_MASK)
+
+    def _has_fn_key(self, name: str) -> bool:
         """Check if keyboard has an Fn key (common on laptops and Mac keyboards)."""
         # Fn key is typically exposed through hid-apple or similar drivers
-        name_file = device_dir / "name"
-        if not name_file.exists():
-            return False
-
-        try:
-            name = name_file.read_text().strip().lower()
-            return "apple" in name or "fn" in name
-        except (OSError, PermissionError):
-            return False
+        name = name.lower()
+        return "apple" in name or "fn" in name
@@ -6,12 +6,16 @@ from pathlib import Path
 
 from dailydriver.models import FnMode, MacKeyboardConfig
 
+# fnmode parameter value -> FnMode, indexed by the raw sysfs integer
+_FNMODE_TABLE = (FnMode.DISABLED, FnMode.FKEYS, FnMode.MEDIA)
+
 
 class HidAppleService:
     """Service for managing hid-apple kernel module configuration."""
 
     MODULE_NAME = "hid_apple"
-    MODULE_PARAMS_PATH = Path("/sys/module/hid_apple/parameters")
+    MODULE_SYSFS_PATH = Path("/sys/module/hid_apple")
+    MODULE_PARAMS_PATH = MODULE_SYSFS_PATH / "parameters"
     MODPROBE_CONF_PATH = Path("/etc/modprobe.d/hid_apple.conf")
 
     def __init__(self) -> None:
@@ -21,6 +25,10 @@ class HidAppleService:
         """Check if hid-apple module is currently loaded."""
         return self.MODULE_PARAMS_PATH.exists()
 
+    def is_available(self) -> bool:
+        """Check if hid-apple is loaded or built into the running kernel."""
+        return self.is_module_loaded() or self.MODULE_SYSFS_PATH.exists()
+
     def get_current_config(self) -> MacKeyboardConfig | None:
         """Read current hid-apple configuration from sysfs."""
         if not self.is_module_loaded():
@@ -30,29 +38,29 @@ class HidAppleService:
             config = MacKeyboardConfig()
 
             # Read fnmode
-            fnmode_file = self.MODULE_PARAMS_PATH / "fnmode"
-            if fnmode_file.exists():
-                fnmode_value = int(fnmode_file.read_text().strip())
-                config.fn_mode = {
-                    0: FnMode.DISABLED,
-                    1: FnMode.FKEYS,
-                    2: FnMode.MEDIA,
-                }.get(fnmode_value, FnMode.MEDIA)
+            fnmode = self._read_param("fnmode")
+            if fnmode is not None:
+                fnmode_value = int(fnmode)
+                config.fn_mode = (
+                    _FNMODE_TABLE[fnmode_value]
+                    if 0 <= fnmode_value < len(_FNMODE_TABLE)
+                    else FnMode.MEDIA
+                )
 
             # Read swap_opt_cmd
-            swap_file = self.MODULE_PARAMS_PATH / "swap_opt_cmd"
-            if swap_file.exists():
-                config.swap_opt_cmd = swap_file.read_text().strip() == "Y"
+            swap = self._read_param("swap_opt_cmd")
+            if swap is not None:
+                config.swap_opt_cmd = swap == "Y"
 
             # Read swap_fn_leftctrl
-            fn_ctrl_file = self.MODULE_PARAMS_PATH / "swap_fn_leftctrl"
-            if fn_ctrl_file.exists():
-                config.swap_fn_leftctrl = fn_ctrl_file.read_text().strip() == "Y"
+            fn_ctrl = self._read_param("swap_fn_leftctrl")
+            if fn_ctrl is not None:
+                config.swap_fn_leftctrl = fn_ctrl == "Y"
 
             # Read iso_layout
-            iso_file = self.MODULE_PARAMS_PATH / "iso_layout"
-            if iso_file.exists():
-                config.iso_layout = iso_file.read_text().strip() == "Y"
+            iso = self._read_param("iso_layout")
+            if iso is not None:
+                config.iso_layout = iso == "Y"
 
             self._cached_config = config
             return config
@@ -60,6 +68,13 @@ class HidAppleService:
         except (OSError, ValueError):
             return None
 
+    def _read_param(self, param: str) -> str | None:
+        """Read a module parameter, or None if the driver does not expose it."""
+        try:
+            return (self.MODULE_PARAMS_PATH / param).read_text().strip()
+        except FileNotFoundError:
+            return None
+
     def apply_config(self, config: MacKeyboardConfig, persistent: bool = True) -> bool:
         """
         Apply hid-apple configuration.
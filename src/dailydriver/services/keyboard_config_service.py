@@ -39,9 +39,9 @@ class CapsLockBehavior(Enum):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModifierConfig:
-    """Modifier key configuration (stored per-profile)."""
+    """Modifier key configuration (stored per-profile, immutable and hashable)."""
 
     # Apple keyboard modifier swaps
     swap_cmd_opt: bool = False  # Swap Cmd↔Option (makes Cmd=Alt, Opt=Super)
@@ -84,10 +84,7 @@ class KeyboardConfigService:
         """Get the globally configured keyboard type."""
         if self._app_settings:
             try:
-                value = self._app_settings.get_string("keyboard-type")
-                for kt in KeyboardType:
-                    if kt.value == value:
-                        return kt
+                return KeyboardType(self._app_settings.get_string("keyboard-type"))
             except Exception:
                 pass
         return KeyboardType.ANSI_104  # Default
@@ -128,9 +125,10 @@ class KeyboardConfigService:
         options = self.get_xkb_options()
         for opt in options:
             if opt.startswith("caps:"):
-                for behavior in CapsLockBehavior:
-                    if behavior.value == opt:
-                        return behavior
+                try:
+                    return CapsLockBehavior(opt)
+                except ValueError:
+                    continue
         return CapsLockBehavior.CAPS_LOCK
 
     def set_caps_lock_behavior(self, behavior: CapsLockBehavior) -> bool:
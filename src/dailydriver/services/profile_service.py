@@ -1,81 +1,127 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 """Service for managing keyboard configuration profiles."""
 
+import os
 from collections.abc import Generator
+from datetime import datetime
 from pathlib import Path
 
 from gi.repository import GLib
 
-from dailydriver.models import Profile, Shortcut
+from dailydriver.models import KeyBinding, Profile, Shortcut
 from dailydriver.services.gsettings_service import GSettingsService
 
 
+def _accels_differ(accelerators: list[str], expected: frozenset[str]) -> bool:
+    """Check whether accelerators differ from an expected set, ignoring order.
+
+    Settles the common shapes (fewer entries than expected, single binding)
+    without building a set.
+    """
+    if len(accelerators) < len(expected):
+        return True
+    if len(accelerators) == 1:
+        return len(expected) != 1 or accelerators[0] not in expected
+    return set(accelerators) != expected
+
+
 class ProfileService:
     """Service for loading, saving, and applying profiles."""
 
     def __init__(self, gsettings_service: GSettingsService | None = None) -> None:
         self._gsettings = gsettings_service or GSettingsService()
+        # Plain str paths: lookups join and stat them without building Path objects
         self._profiles_dir = self._get_profiles_dir()
         self._presets_dir = self._get_presets_dir()
+        # Parsed profiles keyed by path, validated against (st_mtime_ns, st_size).
+        # Files that failed to parse keep their exception so they aren't re-parsed.
+        self._profile_cache: dict[str, tuple[int, int, Profile | Exception]] = {}
 
-    def _get_profiles_dir(self) -> Path:
+    def _get_profiles_dir(self) -> str:
         """Get the user profiles directory."""
-        config_dir = Path(GLib.get_user_config_dir()) / "dailydriver" / "profiles"
-        config_dir.mkdir(parents=True, exist_ok=True)
+        config_dir = os.path.join(GLib.get_user_config_dir(), "dailydriver", "profiles")
+        os.makedirs(config_dir, exist_ok=True)
         return config_dir
 
-    def _get_presets_dir(self) -> Path:
+    def _get_presets_dir(self) -> str:
         """Get the built-in presets directory."""
         # In installed mode, this would be in the data directory
         # For development, use the source tree
         data_dirs = GLib.get_system_data_dirs()
         for data_dir in data_dirs:
-            preset_dir = Path(data_dir) / "dailydriver" / "presets"
-            if preset_dir.exists():
+            preset_dir = os.path.join(data_dir, "dailydriver", "presets")
+            if os.path.isdir(preset_dir):
                 return preset_dir
 
         # Fallback to relative path for development
-        return Path(__file__).parent.parent / "resources" / "presets"
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return os.path.join(package_dir, "resources", "presets")
 
-    def list_profiles(self) -> Generator[Profile, None, None]:
-        """List all available profiles (user + presets)."""
-        # User profiles
-        for path in sorted(self._profiles_dir.glob("*.toml")):
-            try:
-                yield Profile.from_toml(path)
-            except Exception:
-                continue  # Skip invalid profiles
+    def _load_cached(self, path: str | Path, st: os.stat_result | None = None) -> Profile:
+        """Load a profile, reusing the parsed result while the file is unchanged.
 
-        # Built-in presets
-        if self._presets_dir.exists():
-            for path in sorted(self._presets_dir.glob("*.toml")):
+        Pass ``st`` when a stat result is already at hand (e.g. from a DirEntry).
+        Raises FileNotFoundError if the file does not exist, or the original parse
+        error (again) for an unchanged invalid file.
+        """
+        key = os.fspath(path)
+        if st is None:
+            st = os.stat(key)
+        cached = self._profile_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            if isinstance(cached[2], Exception):
+                raise cached[2].with_traceback(None)
+            return cached[2]
+
+        try:
+            profile = Profile.from_toml(Path(key))
+        except Exception as e:
+            self._profile_cache[key] = (st.st_mtime_ns, st.st_size, e)
+            raise
+        self._profile_cache[key] = (st.st_mtime_ns, st.st_size, profile)
+        return profile
+
+    def _iter_toml(self, directory: str | Path) -> list[os.DirEntry[str]]:
+        """List *.toml files in a directory, sorted by name."""
+        try:
+            with os.scandir(directory) as it:
+                entries = [e for e in it if e.name.endswith(".toml") and e.is_file()]
+        except OSError:
+            return []
+        entries.sort(key=lambda e: e.name)
+        return entries
+
+    def list_profiles(self) -> Generator[Profile, None, None]:
+        """List all available profiles (user profiles, then built-in presets)."""
+        for directory in (self._profiles_dir, self._presets_dir):
+            for entry in self._iter_toml(directory):
                 try:
-                    yield Profile.from_toml(path)
+                    yield self._load_cached(entry.path, entry.stat())
                 except Exception:
-                    continue
+                    continue  # Skip invalid profiles
 
     def get_profile(self, name: str) -> Profile | None:
         """Get a profile by name."""
-        # Check user profiles first
-        user_path = self._profiles_dir / f"{name}.toml"
-        if user_path.exists():
-            return Profile.from_toml(user_path)
-
-        # Check presets
-        preset_path = self._presets_dir / f"{name}.toml"
-        if preset_path.exists():
-            return Profile.from_toml(preset_path)
+        # Check user profiles first, then presets
+        for profile_dir in (self._profiles_dir, self._presets_dir):
+            try:
+                return self._load_cached(os.path.join(profile_dir, f"{name}.toml"))
+            except FileNotFoundError:
+                continue
 
         return None
 
     def save_profile(self, profile: Profile) -> Path:
         """Save a profile to disk."""
-        path = self._profiles_dir / f"{profile.name}.toml"
+        path = Path(self._profiles_dir, f"{profile.name}.toml")
         profile.to_toml(path)
         return path
 
     def apply_profile(
-        self, profile: Profile, clean_slate: bool | None = None
+        self,
+        profile: Profile,
+        clean_slate: bool | None = None,
+        current_shortcuts: dict[str, Shortcut] | None = None,
     ) -> dict[str, Shortcut]:
         """Apply a profile, returning shortcuts that were changed.
 
@@ -84,71 +130,58 @@ class ProfileService:
             clean_slate: If True, disable ALL shortcuts first, then apply only
                 what's defined in the profile. If None, auto-detect based on
                 whether profile is a preset (has metadata.preset = True).
+            current_shortcuts: Snapshot from load_all_shortcuts() to reuse instead
+                of loading again. The caller is responsible for its freshness.
         """
         # Auto-detect clean slate mode for presets
         if clean_slate is None:
             clean_slate = profile.metadata.get("preset", False)
 
-        current_shortcuts = self._gsettings.load_all_shortcuts()
+        if current_shortcuts is None:
+            current_shortcuts = self._gsettings.load_all_shortcuts()
         changed: dict[str, Shortcut] = {}
 
-        # Phase 1: If clean slate, disable all shortcuts first
+        # Phase 1: If clean slate, disable all shortcuts the profile doesn't define.
+        # Shortcuts it does define are overwritten in phase 2, so clearing them
+        # first would only double the dconf writes.
         if clean_slate:
+            to_clear: list[Shortcut] = []
             for shortcut_id, shortcut in current_shortcuts.items():
                 # Skip custom keybindings - they're user-defined, not system shortcuts
-                if shortcut.schema == "custom":
+                if shortcut.schema == "custom" or shortcut_id in profile.shortcuts:
                     continue
 
                 # Only clear if shortcut currently has bindings
                 if shortcut.bindings:
                     shortcut.bindings = []
-                    if self._gsettings.save_shortcut(shortcut):
-                        changed[shortcut_id] = shortcut
+                    to_clear.append(shortcut)
 
-        # Phase 2: Apply shortcuts from profile
-        from dailydriver.models import KeyBinding
+            for shortcut in self._gsettings.save_shortcuts_batch(to_clear):
+                changed[shortcut.id] = shortcut
 
+        # Phase 2: Apply shortcuts from profile
+        profile_normalized = profile.normalized_shortcuts()
+        to_save: list[Shortcut] = []
         for storage_key, accelerators in profile.shortcuts.items():
-            # Parse storage key
-            parts = storage_key.rsplit(".", 1)
-            if len(parts) != 2:
+            # Storage keys are "<schema>.<key>", the same form as shortcut IDs
+            shortcut = current_shortcuts.get(storage_key)
+            if shortcut is None:
                 continue
-            schema, key = parts
 
-            # Find matching shortcut
-            shortcut_id = f"{schema}.{key}"
-            if shortcut_id not in current_shortcuts:
-                continue
-
-            shortcut = current_shortcuts[shortcut_id]
-            old_accelerators = shortcut.accelerators
-
-            # Normalize profile accelerators for comparison (GTK reorders modifiers)
-            normalized_profile = set(
-                b.to_accelerator()
-                for accel in accelerators
-                if (b := KeyBinding.from_accelerator(accel))
-            )
-
-            # Check if different (in clean_slate mode, old_accelerators is [] so always apply)
-            if set(old_accelerators) != normalized_profile:
+            # Compare against normalized profile accelerators (GTK reorders modifiers)
+            if _accels_differ(shortcut.accelerators, profile_normalized[storage_key]):
                 # Update bindings
                 shortcut.bindings = [
                     b for accel in accelerators if (b := KeyBinding.from_accelerator(accel))
                 ]
 
-                # Save to GSettings
-                if self._gsettings.save_shortcut(shortcut):
-                    changed[shortcut_id] = shortcut
-
-        return changed
+                to_save.append(shortcut)
 
-    def _normalize_accelerator(self, accel: str) -> str:
-        """Normalize accelerator string through GTK parsing."""
-        from dailydriver.models import KeyBinding
+        # Save to GSettings, one transaction per schema
+        for shortcut in self._gsettings.save_shortcuts_batch(to_save):
+            changed[shortcut.id] = shortcut
 
-        binding = KeyBinding.from_accelerator(accel)
-        return binding.to_accelerator() if binding else accel
+        return changed
 
     def get_profile_diff(self, profile: Profile) -> dict[str, tuple[list[str], list[str]]]:
         """
@@ -158,26 +191,19 @@ class ProfileService:
         """
         current_shortcuts = self._gsettings.load_all_shortcuts()
         diff: dict[str, tuple[list[str], list[str]]] = {}
+        profile_normalized = profile.normalized_shortcuts()
 
         for storage_key, profile_accels in profile.shortcuts.items():
-            # Parse storage key
-            parts = storage_key.rsplit(".", 1)
-            if len(parts) != 2:
-                continue
-            schema, key = parts
-
-            shortcut_id = f"{schema}.{key}"
-            if shortcut_id not in current_shortcuts:
+            # Storage keys are "<schema>.<key>", the same form as shortcut IDs
+            shortcut = current_shortcuts.get(storage_key)
+            if shortcut is None:
                 continue
 
-            current_accels = current_shortcuts[shortcut_id].accelerators
-
-            # Normalize both sides for comparison (GTK reorders modifiers)
-            current_normalized = set(current_accels)
-            profile_normalized = set(self._normalize_accelerator(a) for a in profile_accels)
+            current_accels = shortcut.accelerators
 
-            if current_normalized != profile_normalized:
-                diff[shortcut_id] = (current_accels, profile_accels)
+            # Compare against normalized profile accelerators (GTK reorders modifiers)
+            if _accels_differ(current_accels, profile_normalized[storage_key]):
+                diff[storage_key] = (current_accels, profile_accels)
 
         return diff
 
@@ -190,39 +216,51 @@ class ProfileService:
 
         return profile
 
-    def reset_orphaned_shortcuts(self, old_profile: Profile, new_profile: Profile) -> int:
+    def reset_orphaned_shortcuts(
+        self,
+        old_profile: Profile,
+        new_profile: Profile,
+        current_shortcuts: dict[str, Shortcut] | None = None,
+    ) -> int:
         """
         Reset shortcuts that were in old_profile but not in new_profile to GNOME defaults.
 
+        current_shortcuts may be passed to reuse an existing load_all_shortcuts()
+        snapshot; the caller is responsible for its freshness.
+
         Returns the number of shortcuts reset.
         """
-        old_keys = set(old_profile.shortcuts.keys())
-        new_keys = set(new_profile.shortcuts.keys())
-        orphaned_keys = old_keys - new_keys
+        # dict key views support set operations directly
+        orphaned_keys = old_profile.shortcuts.keys() - new_profile.shortcuts.keys()
 
         if not orphaned_keys:
             return 0
 
-        current_shortcuts = self._gsettings.load_all_shortcuts()
+        if current_shortcuts is None:
+            current_shortcuts = self._gsettings.load_all_shortcuts()
         reset_count = 0
 
-        for storage_key in orphaned_keys:
-            if storage_key in current_shortcuts:
-                shortcut = current_shortcuts[storage_key]
-                # Only reset if it's currently modified from GNOME default
-                if shortcut.is_modified:
-                    shortcut.reset()
-                    self._gsettings.save_shortcut(shortcut)
-                    reset_count += 1
+        for storage_key in orphaned_keys & current_shortcuts.keys():
+            shortcut = current_shortcuts[storage_key]
+            # Only reset if it's currently modified from GNOME default
+            if shortcut.is_modified:
+                shortcut.reset()
+                self._gsettings.save_shortcut(shortcut)
+                reset_count += 1
 
         return reset_count
 
     def get_user_modifications(
-        self, base_preset_name: str
+        self,
+        base_preset_name: str,
+        current_shortcuts: dict[str, Shortcut] | None = None,
     ) -> dict[str, tuple[list[str], list[str]]]:
         """
         Get user modifications compared to a base preset.
 
+        current_shortcuts may be passed to reuse an existing load_all_shortcuts()
+        snapshot; the caller is responsible for its freshness.
+
         Returns dict of shortcut_id -> (current_accelerators, expected_accelerators)
         Includes:
         - Shortcuts defined in preset that differ from preset values
@@ -232,22 +270,27 @@ class ProfileService:
         if not preset:
             return {}
 
-        current_shortcuts = self._gsettings.load_all_shortcuts()
+        if current_shortcuts is None:
+            current_shortcuts = self._gsettings.load_all_shortcuts()
+        return self._compute_user_modifications(preset, current_shortcuts)
+
+    def _compute_user_modifications(
+        self, preset: Profile, current_shortcuts: dict[str, Shortcut]
+    ) -> dict[str, tuple[list[str], list[str]]]:
+        """Diff current shortcuts against an already-loaded preset."""
         diff: dict[str, tuple[list[str], list[str]]] = {}
 
-        # Normalize preset shortcuts for comparison
-        preset_normalized = {}
-        for storage_key, accels in preset.shortcuts.items():
-            preset_normalized[storage_key] = set(self._normalize_accelerator(a) for a in accels)
+        # Normalized preset shortcuts for comparison (cached on the profile)
+        preset_normalized = preset.normalized_shortcuts()
 
         for shortcut_id, shortcut in current_shortcuts.items():
-            current_accels = set(shortcut.accelerators)
+            expected = preset_normalized.get(shortcut_id)
 
-            if shortcut_id in preset_normalized:
+            if expected is not None:
                 # Shortcut is defined in preset - compare against preset value
-                expected = preset_normalized[shortcut_id]
-                if current_accels != expected:
-                    diff[shortcut_id] = (shortcut.accelerators, list(expected))
+                current_accels = shortcut.accelerators
+                if _accels_differ(current_accels, expected):
+                    diff[shortcut_id] = (current_accels, list(expected))
             else:
                 # Shortcut not in preset - preset expects GNOME default
                 if shortcut.is_modified:
@@ -264,15 +307,20 @@ class ProfileService:
         Returns (export_path, num_modifications).
         If no modifications, returns (None, 0).
         """
+        # Load the preset and one snapshot of the current shortcuts once; every step
+        # below shares them
+        base_preset = self.get_profile(base_preset_name)
+        if not base_preset:
+            return None, 0
+        current_shortcuts = self._gsettings.load_all_shortcuts()
+
         # Get user modifications compared to the current preset
-        user_mods = self.get_user_modifications(base_preset_name)
+        user_mods = self._compute_user_modifications(base_preset, current_shortcuts)
 
         if not user_mods:
             return None, 0
 
         # Create profile with user modifications (current values)
-        from datetime import datetime
-
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         name = f"user-mods-{base_preset_name}-{timestamp}"
 
@@ -283,9 +331,8 @@ class ProfileService:
         )
 
         for shortcut_id, (current_accels, _expected_accels) in user_mods.items():
-            parts = shortcut_id.rsplit(".", 1)
-            if len(parts) == 2:
-                schema, key = parts
+            schema, sep, key = shortcut_id.rpartition(".")
+            if sep:
                 mods_profile.set_shortcut(schema, key, current_accels)
 
         num_mods = len(mods_profile.shortcuts)
@@ -294,12 +341,8 @@ class ProfileService:
         export_path = self.save_profile(mods_profile)
 
         # Reset shortcuts not in preset to GNOME defaults
-        base_preset = self.get_profile(base_preset_name)
-        preset_keys = set(base_preset.shortcuts.keys()) if base_preset else set()
-
-        current_shortcuts = self._gsettings.load_all_shortcuts()
         for shortcut_id in user_mods.keys():
-            if shortcut_id not in preset_keys:
+            if shortcut_id not in base_preset.shortcuts:
                 # Not in preset - reset to GNOME default
                 if shortcut_id in current_shortcuts:
                     shortcut = current_shortcuts[shortcut_id]
@@ -307,7 +350,6 @@ class ProfileService:
                     self._gsettings.save_shortcut(shortcut)
 
         # Apply the base preset (for shortcuts defined in preset)
-        if base_preset:
-            self.apply_profile(base_preset)
+        self.apply_profile(base_preset, current_shortcuts=current_shortcuts)
 
         return export_path, num_mods
@@ -2,53 +2,69 @@
 """Keyboard shortcut cheat sheet - clean read-only reference."""
 
 import re
+from collections import defaultdict
+from functools import lru_cache
 
 from gi.repository import Adw, Gio, Gtk, Pango
 
-from dailydriver.models import Shortcut, ShortcutCategory
+from dailydriver.models import KeyBinding, Shortcut, ShortcutCategory
 from dailydriver.services.gsettings_service import GSettingsService
 
-
-def _natural_sort_key(text: str) -> list:
-    """Sort key for natural ordering (Workspace 2 before Workspace 10)."""
-    parts = re.split(r"(\d+)", text)
-    return [int(p) if p.isdigit() else p.lower() for p in parts]
-
-
-def _humanize_binding(binding) -> str:
-    """Convert binding to human-readable label, with better XF86 key names."""
+# Groups hidden from the sheet when tiling is disabled
+_TILING_GROUPS = frozenset({"Tile Halves", "Tile Quarters", "Tile Actions", "Layouts"})
+
+# Splits text into alternating non-digit / digit runs for natural sorting
+_SPLIT_DIGITS = re.compile(r"(\d+)")
+
+
+@lru_cache(maxsize=512)
+def _natural_sort_key(text: str) -> tuple:
+    """Sort key for natural ordering (Workspace 2 before Workspace 10).
+
+    Shortcut names repeat on every refresh, so keys are memoized.
+    """
+    parts = _SPLIT_DIGITS.split(text)
+    return tuple(int(p) if p.isdigit() else p.lower() for p in parts)
+
+
+# Friendly names for XF86 keys (these are physical keys on Mac keyboards)
+_XF86_NAMES: dict[str, str] = {
+    "XF86AudioLowerVolume": "Vol−",
+    "XF86AudioRaiseVolume": "Vol+",
+    "XF86AudioMute": "Mute",
+    "XF86AudioPlay": "Play",
+    "XF86AudioPause": "Pause",
+    "XF86AudioStop": "Stop",
+    "XF86AudioNext": "Next",
+    "XF86AudioPrev": "Prev",
+    "XF86AudioMedia": "Media",
+    "XF86MonBrightnessUp": "Bright+",
+    "XF86MonBrightnessDown": "Bright−",
+    "XF86KbdBrightnessUp": "KbdLight+",
+    "XF86KbdBrightnessDown": "KbdLight−",
+    "XF86Display": "Display",
+    "XF86LaunchA": "F3",
+    "XF86LaunchB": "F4",
+    "XF86Eject": "Eject",
+}
+
+
+@lru_cache(maxsize=256)
+def _humanize_binding(binding: KeyBinding) -> str:
+    """Convert binding to human-readable label, with better XF86 key names.
+
+    KeyBinding is frozen and hashable, so labels are memoized per
+    (keyval, modifiers) and GTK is asked for each label only once.
+    """
     label = binding.to_label()
-    key_name = binding.key_name
-
-    # Map XF86 keys to friendly names (these are physical keys on Mac keyboards)
-    xf86_names = {
-        "XF86AudioLowerVolume": "Vol−",
-        "XF86AudioRaiseVolume": "Vol+",
-        "XF86AudioMute": "Mute",
-        "XF86AudioPlay": "Play",
-        "XF86AudioPause": "Pause",
-        "XF86AudioStop": "Stop",
-        "XF86AudioNext": "Next",
-        "XF86AudioPrev": "Prev",
-        "XF86AudioMedia": "Media",
-        "XF86MonBrightnessUp": "Bright+",
-        "XF86MonBrightnessDown": "Bright−",
-        "XF86KbdBrightnessUp": "KbdLight+",
-        "XF86KbdBrightnessDown": "KbdLight−",
-        "XF86Display": "Display",
-        "XF86LaunchA": "F3",
-        "XF86LaunchB": "F4",
-        "XF86Eject": "Eject",
-    }
-
-    if key_name in xf86_names:
-        # Replace the key portion with friendly name
-        friendly = xf86_names[key_name]
-        # If there are modifiers, they're already in the label
-        if "+" in label:
-            # Get modifier part and replace key
-            parts = label.rsplit("+", 1)
-            return f"{parts[0]}+{friendly}"
+
+    # Replace the key portion with friendly name
+    friendly = _XF86_NAMES.get(binding.key_name)
+    if friendly is not None:
+        # If there are modifiers, they're already in the label; replace the key
+        modifiers, sep, _ = label.rpartition("+")
+        if sep:
+            return modifiers + "+" + friendly
         return friendly
 
     return label
@@ -80,37 +96,40 @@ class ShortcutChip(Gtk.Box):
         self.append(name_label)
 
 
+# Define group ordering for consistent display
+_GROUP_ORDER = (
+    # Window management
+    "Window State",
+    "Window Actions",
+    # Tiling
+    "Tile Halves",
+    "Tile Quarters",
+    "Tile Actions",
+    "Layouts",
+    # Navigation
+    "Switch Windows",
+    "Switch Workspace",
+    "Move to Workspace",
+    "Move to Monitor",
+    # Media
+    "Volume",
+    "Playback",
+    # Shell
+    "Shell Actions",
+    "Screenshots",
+    # System
+    "System",
+    "Accessibility",
+    # Custom
+    "Launchers",
+)
+# Position of each group in _GROUP_ORDER, for O(1) sort keys
+_GROUP_RANK = {name: i for i, name in enumerate(_GROUP_ORDER)}
+
+
 class CategorySection(Gtk.Frame):
     """A section showing shortcuts for one category, organized by groups."""
 
-    # Define group ordering for consistent display
-    GROUP_ORDER = [
-        # Window management
-        "Window State",
-        "Window Actions",
-        # Tiling
-        "Tile Halves",
-        "Tile Quarters",
-        "Tile Actions",
-        "Layouts",
-        # Navigation
-        "Switch Windows",
-        "Switch Workspace",
-        "Move to Workspace",
-        "Move to Monitor",
-        # Media
-        "Volume",
-        "Playback",
-        # Shell
-        "Shell Actions",
-        "Screenshots",
-        # System
-        "System",
-        "Accessibility",
-        # Custom
-        "Launchers",
-    ]
-
     def __init__(self, category: ShortcutCategory, shortcuts: list[Shortcut]) -> None:
         super().__init__()
         self.set_valign(Gtk.Align.START)  # Align to top, don't stretch
@@ -140,20 +159,14 @@ class CategorySection(Gtk.Frame):
         inner.append(header)
 
         # Group shortcuts by their group field
-        groups: dict[str, list[Shortcut]] = {}
+        groups: dict[str, list[Shortcut]] = defaultdict(list)
         for shortcut in shortcuts:
             if shortcut.bindings:
-                group = shortcut.group or "Other"
-                if group not in groups:
-                    groups[group] = []
-                groups[group].append(shortcut)
+                groups[shortcut.group or "Other"].append(shortcut)
 
         # Sort groups by defined order, unknowns at end
         def group_sort_key(group_name: str) -> int:
-            try:
-                return self.GROUP_ORDER.index(group_name)
-            except ValueError:
-                return len(self.GROUP_ORDER)
+            return _GROUP_RANK.get(group_name, len(_GROUP_RANK))
 
         sorted_groups = sorted(groups.keys(), key=group_sort_key)
 
@@ -193,9 +206,9 @@ class CheatSheetView(Gtk.Box):
 
     __gtype_name__ = "CheatSheetView"
 
-    def __init__(self) -> None:
+    def __init__(self, gsettings_service: GSettingsService | None = None) -> None:
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        self._gsettings = GSettingsService()
+        self._gsettings = gsettings_service or GSettingsService()
         self._app_settings = Gio.Settings.new("io.github.gregfelice.DailyDriver")
 
         self._build_ui()
@@ -231,7 +244,16 @@ class CheatSheetView(Gtk.Box):
         clamp.set_maximum_size(1400)
         clamp.set_tightening_threshold(1000)
         scroll.set_child(clamp)
+        self._clamp = clamp
+
+        self._num_columns = 3
+        self._build_columns()
 
+        # Load shortcuts
+        self._load_shortcuts()
+
+    def _build_columns(self) -> None:
+        """Create empty masonry columns and place them in the clamp."""
         # Manual column layout for masonry effect
         self._columns_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=32)
         self._columns_box.set_halign(Gtk.Align.CENTER)
@@ -240,10 +262,8 @@ class CheatSheetView(Gtk.Box):
         self._columns_box.set_margin_end(32)
         self._columns_box.set_margin_top(16)
         self._columns_box.set_margin_bottom(32)
-        clamp.set_child(self._columns_box)
 
         # Create columns
-        self._num_columns = 3
         self._columns: list[Gtk.Box] = []
         for _ in range(self._num_columns):
             col = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
@@ -251,55 +271,62 @@ class CheatSheetView(Gtk.Box):
             self._columns.append(col)
             self._columns_box.append(col)
 
-        # Load shortcuts
-        self._load_shortcuts()
+        # Replaces (and drops) any previous columns box in one swap
+        self._clamp.set_child(self._columns_box)
 
-    def _load_shortcuts(self) -> None:
+    def _load_shortcuts(self, shortcuts: dict[str, Shortcut] | None = None) -> None:
         """Load and display all shortcuts."""
-        shortcuts = self._gsettings.load_all_shortcuts()
+        if shortcuts is None:
+            shortcuts = self._gsettings.load_all_shortcuts()
         all_categories = self._gsettings.get_categories()
 
         # Filter categories based on tiling setting
         tiling_enabled = self._app_settings.get_boolean("tiling-enabled")
-        tiling_groups = {"Tile Halves", "Tile Quarters", "Tile Actions", "Layouts"}
 
         categories = [c for c in all_categories if tiling_enabled or c.id != "tiling"]
 
+        # Bucket bound shortcuts by category in a single pass
+        hidden_groups = frozenset() if tiling_enabled else _TILING_GROUPS
+        by_category: dict[str, list[Shortcut]] = defaultdict(list)
+        for s in shortcuts.values():
+            if s.bindings and s.group not in hidden_groups:
+                by_category[s.category].append(s)
+
         # Collect sections with their estimated heights
         sections: list[tuple[CategorySection, int]] = []
         for category in categories:
-            category_shortcuts = [
-                s
-                for s in shortcuts.values()
-                if s.category == category.id
-                and s.bindings
-                and (tiling_enabled or s.group not in tiling_groups)
-            ]
+            category_shortcuts = by_category.get(category.id)
 
             if category_shortcuts:
-                category_shortcuts.sort(key=lambda s: _natural_sort_key(s.name))
                 section = CategorySection(category, category_shortcuts)
-                # Estimate height: header + shortcuts
-                est_height = 1 + len(category_shortcuts)
+                # Estimate height: header + shortcuts, plus a sub-header per group
+                # and a separator between groups when group headers are shown
+                num_groups = len({s.group or "Other" for s in category_shortcuts})
+                est_height = len(category_shortcuts) + (2 * num_groups if num_groups > 1 else 1)
                 sections.append((section, est_height))
 
-        # Distribute to columns (shortest column first)
+        # Distribute to columns (shortest column first). The columns are
+        # hidden meanwhile so GTK lays them out once, not per appended section.
+        self._columns_box.set_visible(False)
         column_heights = [0] * self._num_columns
         for section, height in sections:
             # Find shortest column
-            min_col = column_heights.index(min(column_heights))
+            min_col = min(range(self._num_columns), key=column_heights.__getitem__)
             # Apply larger left margin for center and right columns
             if min_col > 0:
                 section.get_child().set_margin_start(25)
             self._columns[min_col].append(section)
             column_heights[min_col] += height
+        self._columns_box.set_visible(True)
 
-    def refresh(self) -> None:
-        """Refresh the cheat sheet with current shortcuts."""
-        # Clear existing
-        for col in self._columns:
-            while child := col.get_first_child():
-                col.remove(child)
+    def refresh(self, shortcuts: dict[str, Shortcut] | None = None) -> None:
+        """Refresh the cheat sheet with current shortcuts.
+
+        Callers that already hold freshly loaded shortcuts can pass them in
+        to avoid reading every schema again.
+        """
+        # Swap in fresh columns instead of removing sections one by one
+        self._build_columns()
 
         # Reload
-        self._load_shortcuts()
+        self._load_shortcuts(shortcuts)
@@ -17,6 +17,247 @@ from dailydriver.models import Key, KeyboardLayout, KeyboardType, Shortcut
 # PC KEYBOARD LAYOUTS
 # =============================================================================
 
+# Shared ANSI key groups, positioned for layouts with a function row.
+# ANSI-60 reuses the alphanumeric and bottom rows shifted up a row.
+_ANSI_FUNCTION_ROW = [
+    {"x": 0, "y": 0, "label": "Esc", "keyval": 65307, "row": 0},
+    {"x": 2, "y": 0, "label": "F1", "keyval": 65470, "row": 0},
+    {"x": 3, "y": 0, "label": "F2", "keyval": 65471, "row": 0},
+    {"x": 4, "y": 0, "label": "F3", "keyval": 65472, "row": 0},
+    {"x": 5, "y": 0, "label": "F4", "keyval": 65473, "row": 0},
+    {"x": 6.5, "y": 0, "label": "F5", "keyval": 65474, "row": 0},
+    {"x": 7.5, "y": 0, "label": "F6", "keyval": 65475, "row": 0},
+    {"x": 8.5, "y": 0, "label": "F7", "keyval": 65476, "row": 0},
+    {"x": 9.5, "y": 0, "label": "F8", "keyval": 65477, "row": 0},
+    {"x": 11, "y": 0, "label": "F9", "keyval": 65478, "row": 0},
+    {"x": 12, "y": 0, "label": "F10", "keyval": 65479, "row": 0},
+    {"x": 13, "y": 0, "label": "F11", "keyval": 65480, "row": 0},
+    {"x": 14, "y": 0, "label": "F12", "keyval": 65481, "row": 0},
+    # Print/Scroll/Pause
+    {"x": 15.25, "y": 0, "label": "Prt", "keyval": 65377, "row": 0},
+    {"x": 16.25, "y": 0, "label": "Scr", "keyval": 65300, "row": 0},
+    {"x": 17.25, "y": 0, "label": "Pse", "keyval": 65299, "row": 0},
+]
+
+# Leftmost number-row key; 60% boards put Esc here instead
+_ANSI_GRAVE_KEY = {"x": 0, "y": 1.5, "label": "`", "secondary": "~", "keyval": 96, "row": 1}
+
+_ANSI_ALPHA_ROWS = [
+    # === Number row ===
+    {"x": 1, "y": 1.5, "label": "1", "secondary": "!", "keyval": 49, "row": 1},
+    {"x": 2, "y": 1.5, "label": "2", "secondary": "@", "keyval": 50, "row": 1},
+    {"x": 3, "y": 1.5, "label": "3", "secondary": "#", "keyval": 51, "row": 1},
+    {"x": 4, "y": 1.5, "label": "4", "secondary": "$", "keyval": 52, "row": 1},
+    {"x": 5, "y": 1.5, "label": "5", "secondary": "%", "keyval": 53, "row": 1},
+    {"x": 6, "y": 1.5, "label": "6", "secondary": "^", "keyval": 54, "row": 1},
+    {"x": 7, "y": 1.5, "label": "7", "secondary": "&", "keyval": 55, "row": 1},
+    {"x": 8, "y": 1.5, "label": "8", "secondary": "*", "keyval": 56, "row": 1},
+    {"x": 9, "y": 1.5, "label": "9", "secondary": "(", "keyval": 57, "row": 1},
+    {"x": 10, "y": 1.5, "label": "0", "secondary": ")", "keyval": 48, "row": 1},
+    {"x": 11, "y": 1.5, "label": "-", "secondary": "_", "keyval": 45, "row": 1},
+    {"x": 12, "y": 1.5, "label": "=", "secondary": "+", "keyval": 61, "row": 1},
+    {
+        "x": 13,
+        "y": 1.5,
+        "width": 2,
+        "label": "Bksp",
+        "keyval": 65288,
+        "row": 1,
+        "special": True,
+    },
+    # === Tab row ===
+    {
+        "x": 0,
+        "y": 2.5,
+        "width": 1.5,
+        "label": "Tab",
+        "keyval": 65289,
+        "row": 2,
+        "special": True,
+    },
+    {"x": 1.5, "y": 2.5, "label": "Q", "keyval": 113, "row": 2},
+    {"x": 2.5, "y": 2.5, "label": "W", "keyval": 119, "row": 2},
+    {"x": 3.5, "y": 2.5, "label": "E", "keyval": 101, "row": 2},
+    {"x": 4.5, "y": 2.5, "label": "R", "keyval": 114, "row": 2},
+    {"x": 5.5, "y": 2.5, "label": "T", "keyval": 116, "row": 2},
+    {"x": 6.5, "y": 2.5, "label": "Y", "keyval": 121, "row": 2},
+    {"x": 7.5, "y": 2.5, "label": "U", "keyval": 117, "row": 2},
+    {"x": 8.5, "y": 2.5, "label": "I", "keyval": 105, "row": 2},
+    {"x": 9.5, "y": 2.5, "label": "O", "keyval": 111, "row": 2},
+    {"x": 10.5, "y": 2.5, "label": "P", "keyval": 112, "row": 2},
+    {"x": 11.5, "y": 2.5, "label": "[", "secondary": "{", "keyval": 91, "row": 2},
+    {"x": 12.5, "y": 2.5, "label": "]", "secondary": "}", "keyval": 93, "row": 2},
+    {
+        "x": 13.5,
+        "y": 2.5,
+        "width": 1.5,
+        "label": "\\",
+        "secondary": "|",
+        "keyval": 92,
+        "row": 2,
+    },
+    # === Caps row ===
+    {
+        "x": 0,
+        "y": 3.5,
+        "width": 1.75,
+        "label": "Caps",
+        "keyval": 65509,
+        "row": 3,
+        "modifier": True,
+    },
+    {"x": 1.75, "y": 3.5, "label": "A", "keyval": 97, "row": 3},
+    {"x": 2.75, "y": 3.5, "label": "S", "keyval": 115, "row": 3},
+    {"x": 3.75, "y": 3.5, "label": "D", "keyval": 100, "row": 3},
+    {"x": 4.75, "y": 3.5, "label": "F", "keyval": 102, "row": 3},
+    {"x": 5.75, "y": 3.5, "label": "G", "keyval": 103, "row": 3},
+    {"x": 6.75, "y": 3.5, "label": "H", "keyval": 104, "row": 3},
+    {"x": 7.75, "y": 3.5, "label": "J", "keyval": 106, "row": 3},
+    {"x": 8.75, "y": 3.5, "label": "K", "keyval": 107, "row": 3},
+    {"x": 9.75, "y": 3.5, "label": "L", "keyval": 108, "row": 3},
+    {"x": 10.75, "y": 3.5, "label": ";", "secondary": ":", "keyval": 59, "row": 3},
+    {"x": 11.75, "y": 3.5, "label": "'", "secondary": '"', "keyval": 39, "row": 3},
+    {
+        "x": 12.75,
+        "y": 3.5,
+        "width": 2.25,
+        "label": "Enter",
+        "keyval": 65293,
+        "row": 3,
+        "special": True,
+    },
+    # === Shift row ===
+    {
+        "x": 0,
+        "y": 4.5,
+        "width": 2.25,
+        "label": "Shift",
+        "keyval": 65505,
+        "row": 4,
+        "modifier": True,
+    },
+    {"x": 2.25, "y": 4.5, "label": "Z", "keyval": 122, "row": 4},
+    {"x": 3.25, "y": 4.5, "label": "X", "keyval": 120, "row": 4},
+    {"x": 4.25, "y": 4.5, "label": "C", "keyval": 99, "row": 4},
+    {"x": 5.25, "y": 4.5, "label": "V", "keyval": 118, "row": 4},
+    {"x": 6.25, "y": 4.5, "label": "B", "keyval": 98, "row": 4},
+    {"x": 7.25, "y": 4.5, "label": "N", "keyval": 110, "row": 4},
+    {"x": 8.25, "y": 4.5, "label": "M", "keyval": 109, "row": 4},
+    {"x": 9.25, "y": 4.5, "label": ",", "secondary": "<", "keyval": 44, "row": 4},
+    {"x": 10.25, "y": 4.5, "label": ".", "secondary": ">", "keyval": 46, "row": 4},
+    {"x": 11.25, "y": 4.5, "label": "/", "secondary": "?", "keyval": 47, "row": 4},
+    {
+        "x": 12.25,
+        "y": 4.5,
+        "width": 2.75,
+        "label": "Shift",
+        "keyval": 65506,
+        "row": 4,
+        "modifier": True,
+    },
+]
+
+_ANSI_BOTTOM_ROW = [
+    {
+        "x": 0,
+        "y": 5.5,
+        "width": 1.25,
+        "label": "Ctrl",
+        "keyval": 65507,
+        "row": 5,
+        "modifier": True,
+    },
+    {
+        "x": 1.25,
+        "y": 5.5,
+        "width": 1.25,
+        "label": "Super",
+        "keyval": 65515,
+        "row": 5,
+        "modifier": True,
+    },
+    {
+        "x": 2.5,
+        "y": 5.5,
+        "width": 1.25,
+        "label": "Alt",
+        "keyval": 65513,
+        "row": 5,
+        "modifier": True,
+    },
+    {"x": 3.75, "y": 5.5, "width": 6.25, "label": "", "keyval": 32, "row": 5},
+    {
+        "x": 10,
+        "y": 5.5,
+        "width": 1.25,
+        "label": "Alt",
+        "keyval": 65514,
+        "row": 5,
+        "modifier": True,
+    },
+    {
+        "x": 11.25,
+        "y": 5.5,
+        "width": 1.25,
+        "label": "Super",
+        "keyval": 65516,
+        "row": 5,
+        "modifier": True,
+    },
+    {"x": 12.5, "y": 5.5, "width": 1.25, "label": "Menu", "keyval": 65383, "row": 5},
+    {
+        "x": 13.75,
+        "y": 5.5,
+        "width": 1.25,
+        "label": "Ctrl",
+        "keyval": 65508,
+        "row": 5,
+        "modifier": True,
+    },
+]
+
+_ANSI_NAV_CLUSTER = [
+    {"x": 15.25, "y": 1.5, "label": "Ins", "keyval": 65379, "row": 1},
+    {"x": 16.25, "y": 1.5, "label": "Hm", "keyval": 65360, "row": 1},
+    {"x": 17.25, "y": 1.5, "label": "PU", "keyval": 65365, "row": 1},
+    {"x": 15.25, "y": 2.5, "label": "Del", "keyval": 65535, "row": 2},
+    {"x": 16.25, "y": 2.5, "label": "End", "keyval": 65367, "row": 2},
+    {"x": 17.25, "y": 2.5, "label": "PD", "keyval": 65366, "row": 2},
+]
+
+_ANSI_ARROWS = [
+    {"x": 16.25, "y": 4.5, "label": "^", "keyval": 65362, "row": 4},
+    {"x": 15.25, "y": 5.5, "label": "<", "keyval": 65361, "row": 5},
+    {"x": 16.25, "y": 5.5, "label": "v", "keyval": 65364, "row": 5},
+    {"x": 17.25, "y": 5.5, "label": ">", "keyval": 65363, "row": 5},
+]
+
+_ANSI_NUMPAD = [
+    {"x": 18.5, "y": 1.5, "label": "Num", "keyval": 65407, "row": 1},
+    {"x": 19.5, "y": 1.5, "label": "/", "keyval": 65455, "row": 1},
+    {"x": 20.5, "y": 1.5, "label": "*", "keyval": 65450, "row": 1},
+    {"x": 21.5, "y": 1.5, "label": "-", "keyval": 65453, "row": 1},
+    {"x": 18.5, "y": 2.5, "label": "7", "keyval": 65463, "row": 2},
+    {"x": 19.5, "y": 2.5, "label": "8", "keyval": 65464, "row": 2},
+    {"x": 20.5, "y": 2.5, "label": "9", "keyval": 65465, "row": 2},
+    {"x": 21.5, "y": 2.5, "height": 2, "label": "+", "keyval": 65451, "row": 2},
+    {"x": 18.5, "y": 3.5, "label": "4", "keyval": 65460, "row": 3},
+    {"x": 19.5, "y": 3.5, "label": "5", "keyval": 65461, "row": 3},
+    {"x": 20.5, "y": 3.5, "label": "6", "keyval": 65462, "row": 3},
+    {"x": 18.5, "y": 4.5, "label": "1", "keyval": 65457, "row": 4},
+    {"x": 19.5, "y": 4.5, "label": "2", "keyval": 65458, "row": 4},
+    {"x": 20.5, "y": 4.5, "label": "3", "keyval": 65459, "row": 4},
+    {"x": 21.5, "y": 4.5, "height": 2, "label": "Ent", "keyval": 65421, "row": 4},
+    {"x": 18.5, "y": 5.5, "width": 2, "label": "0", "keyval": 65456, "row": 5},
+    {"x": 20.5, "y": 5.5, "label": ".", "keyval": 65454, "row": 5},
+]
+
+
+def _without_function_row(keys: list[dict]) -> list[dict]:
+    """Copy key definitions moved up into the space of a missing function row."""
+    return [{**key, "y": key["y"] - 1.5, "row": key["row"] - 1} for key in keys]
+
+
 # ANSI-104 Full Size (with numpad)
 ANSI_104_DATA = {
     "id": "ansi-104",
@@ -25,230 +266,13 @@ ANSI_104_DATA = {
     "width": 22.75,
     "height": 6.5,
     "keys": [
-        # === Function row ===
-        {"x": 0, "y": 0, "label": "Esc", "keyval": 65307, "row": 0},
-        {"x": 2, "y": 0, "label": "F1", "keyval": 65470, "row": 0},
-        {"x": 3, "y": 0, "label": "F2", "keyval": 65471, "row": 0},
-        {"x": 4, "y": 0, "label": "F3", "keyval": 65472, "row": 0},
-        {"x": 5, "y": 0, "label": "F4", "keyval": 65473, "row": 0},
-        {"x": 6.5, "y": 0, "label": "F5", "keyval": 65474, "row": 0},
-        {"x": 7.5, "y": 0, "label": "F6", "keyval": 65475, "row": 0},
-        {"x": 8.5, "y": 0, "label": "F7", "keyval": 65476, "row": 0},
-        {"x": 9.5, "y": 0, "label": "F8", "keyval": 65477, "row": 0},
-        {"x": 11, "y": 0, "label": "F9", "keyval": 65478, "row": 0},
-        {"x": 12, "y": 0, "label": "F10", "keyval": 65479, "row": 0},
-        {"x": 13, "y": 0, "label": "F11", "keyval": 65480, "row": 0},
-        {"x": 14, "y": 0, "label": "F12", "keyval": 65481, "row": 0},
-        # Print/Scroll/Pause
-        {"x": 15.25, "y": 0, "label": "Prt", "keyval": 65377, "row": 0},
-        {"x": 16.25, "y": 0, "label": "Scr", "keyval": 65300, "row": 0},
-        {"x": 17.25, "y": 0, "label": "Pse", "keyval": 65299, "row": 0},
-        # === Number row ===
-        {"x": 0, "y": 1.5, "label": "`", "secondary": "~", "keyval": 96, "row": 1},
-        {"x": 1, "y": 1.5, "label": "1", "secondary": "!", "keyval": 49, "row": 1},
-        {"x": 2, "y": 1.5, "label": "2", "secondary": "@", "keyval": 50, "row": 1},
-        {"x": 3, "y": 1.5, "label": "3", "secondary": "#", "keyval": 51, "row": 1},
-        {"x": 4, "y": 1.5, "label": "4", "secondary": "$", "keyval": 52, "row": 1},
-        {"x": 5, "y": 1.5, "label": "5", "secondary": "%", "keyval": 53, "row": 1},
-        {"x": 6, "y": 1.5, "label": "6", "secondary": "^", "keyval": 54, "row": 1},
-        {"x": 7, "y": 1.5, "label": "7", "secondary": "&", "keyval": 55, "row": 1},
-        {"x": 8, "y": 1.5, "label": "8", "secondary": "*", "keyval": 56, "row": 1},
-        {"x": 9, "y": 1.5, "label": "9", "secondary": "(", "keyval": 57, "row": 1},
-        {"x": 10, "y": 1.5, "label": "0", "secondary": ")", "keyval": 48, "row": 1},
-        {"x": 11, "y": 1.5, "label": "-", "secondary": "_", "keyval": 45, "row": 1},
-        {"x": 12, "y": 1.5, "label": "=", "secondary": "+", "keyval": 61, "row": 1},
-        {
-            "x": 13,
-            "y": 1.5,
-            "width": 2,
-            "label": "Bksp",
-            "keyval": 65288,
-            "row": 1,
-            "special": True,
-        },
-        # Nav cluster
-        {"x": 15.25, "y": 1.5, "label": "Ins", "keyval": 65379, "row": 1},
-        {"x": 16.25, "y": 1.5, "label": "Hm", "keyval": 65360, "row": 1},
-        {"x": 17.25, "y": 1.5, "label": "PU", "keyval": 65365, "row": 1},
-        # Numpad top
-        {"x": 18.5, "y": 1.5, "label": "Num", "keyval": 65407, "row": 1},
-        {"x": 19.5, "y": 1.5, "label": "/", "keyval": 65455, "row": 1},
-        {"x": 20.5, "y": 1.5, "label": "*", "keyval": 65450, "row": 1},
-        {"x": 21.5, "y": 1.5, "label": "-", "keyval": 65453, "row": 1},
-        # === Tab row ===
-        {
-            "x": 0,
-            "y": 2.5,
-            "width": 1.5,
-            "label": "Tab",
-            "keyval": 65289,
-            "row": 2,
-            "special": True,
-        },
-        {"x": 1.5, "y": 2.5, "label": "Q", "keyval": 113, "row": 2},
-        {"x": 2.5, "y": 2.5, "label": "W", "keyval": 119, "row": 2},
-        {"x": 3.5, "y": 2.5, "label": "E", "keyval": 101, "row": 2},
-        {"x": 4.5, "y": 2.5, "label": "R", "keyval": 114, "row": 2},
-        {"x": 5.5, "y": 2.5, "label": "T", "keyval": 116, "row": 2},
-        {"x": 6.5, "y": 2.5, "label": "Y", "keyval": 121, "row": 2},
-        {"x": 7.5, "y": 2.5, "label": "U", "keyval": 117, "row": 2},
-        {"x": 8.5, "y": 2.5, "label": "I", "keyval": 105, "row": 2},
-        {"x": 9.5, "y": 2.5, "label": "O", "keyval": 111, "row": 2},
-        {"x": 10.5, "y": 2.5, "label": "P", "keyval": 112, "row": 2},
-        {"x": 11.5, "y": 2.5, "label": "[", "secondary": "{", "keyval": 91, "row": 2},
-        {"x": 12.5, "y": 2.5, "label": "]", "secondary": "}", "keyval": 93, "row": 2},
-        {
-            "x": 13.5,
-            "y": 2.5,
-            "width": 1.5,
-            "label": "\\",
-            "secondary": "|",
-            "keyval": 92,
-            "row": 2,
-        },
-        # Nav
-        {"x": 15.25, "y": 2.5, "label": "Del", "keyval": 65535, "row": 2},
-        {"x": 16.25, "y": 2.5, "label": "End", "keyval": 65367, "row": 2},
-        {"x": 17.25, "y": 2.5, "label": "PD", "keyval": 65366, "row": 2},
-        # Numpad
-        {"x": 18.5, "y": 2.5, "label": "7", "keyval": 65463, "row": 2},
-        {"x": 19.5, "y": 2.5, "label": "8", "keyval": 65464, "row": 2},
-        {"x": 20.5, "y": 2.5, "label": "9", "keyval": 65465, "row": 2},
-        {"x": 21.5, "y": 2.5, "height": 2, "label": "+", "keyval": 65451, "row": 2},
-        # === Caps row ===
-        {
-            "x": 0,
-            "y": 3.5,
-            "width": 1.75,
-            "label": "Caps",
-            "keyval": 65509,
-            "row": 3,
-            "modifier": True,
-        },
-        {"x": 1.75, "y": 3.5, "label": "A", "keyval": 97, "row": 3},
-        {"x": 2.75, "y": 3.5, "label": "S", "keyval": 115, "row": 3},
-        {"x": 3.75, "y": 3.5, "label": "D", "keyval": 100, "row": 3},
-        {"x": 4.75, "y": 3.5, "label": "F", "keyval": 102, "row": 3},
-        {"x": 5.75, "y": 3.5, "label": "G", "keyval": 103, "row": 3},
-        {"x": 6.75, "y": 3.5, "label": "H", "keyval": 104, "row": 3},
-        {"x": 7.75, "y": 3.5, "label": "J", "keyval": 106, "row": 3},
-        {"x": 8.75, "y": 3.5, "label": "K", "keyval": 107, "row": 3},
-        {"x": 9.75, "y": 3.5, "label": "L", "keyval": 108, "row": 3},
-        {"x": 10.75, "y": 3.5, "label": ";", "secondary": ":", "keyval": 59, "row": 3},
-        {"x": 11.75, "y": 3.5, "label": "'", "secondary": '"', "keyval": 39, "row": 3},
-        {
-            "x": 12.75,
-            "y": 3.5,
-            "width": 2.25,
-            "label": "Enter",
-            "keyval": 65293,
-            "row": 3,
-            "special": True,
-        },
-        # Numpad
-        {"x": 18.5, "y": 3.5, "label": "4", "keyval": 65460, "row": 3},
-        {"x": 19.5, "y": 3.5, "label": "5", "keyval": 65461, "row": 3},
-        {"x": 20.5, "y": 3.5, "label": "6", "keyval": 65462, "row": 3},
-        # === Shift row ===
-        {
-            "x": 0,
-            "y": 4.5,
-            "width": 2.25,
-            "label": "Shift",
-            "keyval": 65505,
-            "row": 4,
-            "modifier": True,
-        },
-        {"x": 2.25, "y": 4.5, "label": "Z", "keyval": 122, "row": 4},
-        {"x": 3.25, "y": 4.5, "label": "X", "keyval": 120, "row": 4},
-        {"x": 4.25, "y": 4.5, "label": "C", "keyval": 99, "row": 4},
-        {"x": 5.25, "y": 4.5, "label": "V", "keyval": 118, "row": 4},
-        {"x": 6.25, "y": 4.5, "label": "B", "keyval": 98, "row": 4},
-        {"x": 7.25, "y": 4.5, "label": "N", "keyval": 110, "row": 4},
-        {"x": 8.25, "y": 4.5, "label": "M", "keyval": 109, "row": 4},
-        {"x": 9.25, "y": 4.5, "label": ",", "secondary": "<", "keyval": 44, "row": 4},
-        {"x": 10.25, "y": 4.5, "label": ".", "secondary": ">", "keyval": 46, "row": 4},
-        {"x": 11.25, "y": 4.5, "label": "/", "secondary": "?", "keyval": 47, "row": 4},
-        {
-            "x": 12.25,
-            "y": 4.5,
-            "width": 2.75,
-            "label": "Shift",
-            "keyval": 65506,
-            "row": 4,
-            "modifier": True,
-        },
-        # Arrow up
-        {"x": 16.25, "y": 4.5, "label": "^", "keyval": 65362, "row": 4},
-        # Numpad
-        {"x": 18.5, "y": 4.5, "label": "1", "keyval": 65457, "row": 4},
-        {"x": 19.5, "y": 4.5, "label": "2", "keyval": 65458, "row": 4},
-        {"x": 20.5, "y": 4.5, "label": "3", "keyval": 65459, "row": 4},
-        {"x": 21.5, "y": 4.5, "height": 2, "label": "Ent", "keyval": 65421, "row": 4},
-        # === Bottom row ===
-        {
-            "x": 0,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Ctrl",
-            "keyval": 65507,
-            "row": 5,
-            "modifier": True,
-        },
-        {
-            "x": 1.25,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Super",
-            "keyval": 65515,
-            "row": 5,
-            "modifier": True,
-        },
-        {
-            "x": 2.5,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Alt",
-            "keyval": 65513,
-            "row": 5,
-            "modifier": True,
-        },
-        {"x": 3.75, "y": 5.5, "width": 6.25, "label": "", "keyval": 32, "row": 5},
-        {
-            "x": 10,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Alt",
-            "keyval": 65514,
-            "row": 5,
-            "modifier": True,
-        },
-        {
-            "x": 11.25,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Super",
-            "keyval": 65516,
-            "row": 5,
-            "modifier": True,
-        },
-        {"x": 12.5, "y": 5.5, "width": 1.25, "label": "Menu", "keyval": 65383, "row": 5},
-        {
-            "x": 13.75,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Ctrl",
-            "keyval": 65508,
-            "row": 5,
-            "modifier": True,
-        },
-        # Arrows
-        {"x": 15.25, "y": 5.5, "label": "<", "keyval": 65361, "row": 5},
-        {"x": 16.25, "y": 5.5, "label": "v", "keyval": 65364, "row": 5},
-        {"x": 17.25, "y": 5.5, "label": ">", "keyval": 65363, "row": 5},
-        # Numpad
-        {"x": 18.5, "y": 5.5, "width": 2, "label": "0", "keyval": 65456, "row": 5},
-        {"x": 20.5, "y": 5.5, "label": ".", "keyval": 65454, "row": 5},
+        *_ANSI_FUNCTION_ROW,
+        _ANSI_GRAVE_KEY,
+        *_ANSI_ALPHA_ROWS,
+        *_ANSI_BOTTOM_ROW,
+        *_ANSI_NAV_CLUSTER,
+        *_ANSI_ARROWS,
+        *_ANSI_NUMPAD,
     ],
 }
 
@@ -260,208 +284,12 @@ ANSI_87_DATA = {
     "width": 18.25,
     "height": 6.5,
     "keys": [
-        # === Function row ===
-        {"x": 0, "y": 0, "label": "Esc", "keyval": 65307, "row": 0},
-        {"x": 2, "y": 0, "label": "F1", "keyval": 65470, "row": 0},
-        {"x": 3, "y": 0, "label": "F2", "keyval": 65471, "row": 0},
-        {"x": 4, "y": 0, "label": "F3", "keyval": 65472, "row": 0},
-        {"x": 5, "y": 0, "label": "F4", "keyval": 65473, "row": 0},
-        {"x": 6.5, "y": 0, "label": "F5", "keyval": 65474, "row": 0},
-        {"x": 7.5, "y": 0, "label": "F6", "keyval": 65475, "row": 0},
-        {"x": 8.5, "y": 0, "label": "F7", "keyval": 65476, "row": 0},
-        {"x": 9.5, "y": 0, "label": "F8", "keyval": 65477, "row": 0},
-        {"x": 11, "y": 0, "label": "F9", "keyval": 65478, "row": 0},
-        {"x": 12, "y": 0, "label": "F10", "keyval": 65479, "row": 0},
-        {"x": 13, "y": 0, "label": "F11", "keyval": 65480, "row": 0},
-        {"x": 14, "y": 0, "label": "F12", "keyval": 65481, "row": 0},
-        # Print/Scroll/Pause
-        {"x": 15.25, "y": 0, "label": "Prt", "keyval": 65377, "row": 0},
-        {"x": 16.25, "y": 0, "label": "Scr", "keyval": 65300, "row": 0},
-        {"x": 17.25, "y": 0, "label": "Pse", "keyval": 65299, "row": 0},
-        # === Number row ===
-        {"x": 0, "y": 1.5, "label": "`", "secondary": "~", "keyval": 96, "row": 1},
-        {"x": 1, "y": 1.5, "label": "1", "secondary": "!", "keyval": 49, "row": 1},
-        {"x": 2, "y": 1.5, "label": "2", "secondary": "@", "keyval": 50, "row": 1},
-        {"x": 3, "y": 1.5, "label": "3", "secondary": "#", "keyval": 51, "row": 1},
-        {"x": 4, "y": 1.5, "label": "4", "secondary": "$", "keyval": 52, "row": 1},
-        {"x": 5, "y": 1.5, "label": "5", "secondary": "%", "keyval": 53, "row": 1},
-        {"x": 6, "y": 1.5, "label": "6", "secondary": "^", "keyval": 54, "row": 1},
-        {"x": 7, "y": 1.5, "label": "7", "secondary": "&", "keyval": 55, "row": 1},
-        {"x": 8, "y": 1.5, "label": "8", "secondary": "*", "keyval": 56, "row": 1},
-        {"x": 9, "y": 1.5, "label": "9", "secondary": "(", "keyval": 57, "row": 1},
-        {"x": 10, "y": 1.5, "label": "0", "secondary": ")", "keyval": 48, "row": 1},
-        {"x": 11, "y": 1.5, "label": "-", "secondary": "_", "keyval": 45, "row": 1},
-        {"x": 12, "y": 1.5, "label": "=", "secondary": "+", "keyval": 61, "row": 1},
-        {
-            "x": 13,
-            "y": 1.5,
-            "width": 2,
-            "label": "Bksp",
-            "keyval": 65288,
-            "row": 1,
-            "special": True,
-        },
-        # Nav cluster
-        {"x": 15.25, "y": 1.5, "label": "Ins", "keyval": 65379, "row": 1},
-        {"x": 16.25, "y": 1.5, "label": "Hm", "keyval": 65360, "row": 1},
-        {"x": 17.25, "y": 1.5, "label": "PU", "keyval": 65365, "row": 1},
-        # === Tab row ===
-        {
-            "x": 0,
-            "y": 2.5,
-            "width": 1.5,
-            "label": "Tab",
-            "keyval": 65289,
-            "row": 2,
-            "special": True,
-        },
-        {"x": 1.5, "y": 2.5, "label": "Q", "keyval": 113, "row": 2},
-        {"x": 2.5, "y": 2.5, "label": "W", "keyval": 119, "row": 2},
-        {"x": 3.5, "y": 2.5, "label": "E", "keyval": 101, "row": 2},
-        {"x": 4.5, "y": 2.5, "label": "R", "keyval": 114, "row": 2},
-        {"x": 5.5, "y": 2.5, "label": "T", "keyval": 116, "row": 2},
-        {"x": 6.5, "y": 2.5, "label": "Y", "keyval": 121, "row": 2},
-        {"x": 7.5, "y": 2.5, "label": "U", "keyval": 117, "row": 2},
-        {"x": 8.5, "y": 2.5, "label": "I", "keyval": 105, "row": 2},
-        {"x": 9.5, "y": 2.5, "label": "O", "keyval": 111, "row": 2},
-        {"x": 10.5, "y": 2.5, "label": "P", "keyval": 112, "row": 2},
-        {"x": 11.5, "y": 2.5, "label": "[", "secondary": "{", "keyval": 91, "row": 2},
-        {"x": 12.5, "y": 2.5, "label": "]", "secondary": "}", "keyval": 93, "row": 2},
-        {
-            "x": 13.5,
-            "y": 2.5,
-            "width": 1.5,
-            "label": "\\",
-            "secondary": "|",
-            "keyval": 92,
-            "row": 2,
-        },
-        # Nav
-        {"x": 15.25, "y": 2.5, "label": "Del", "keyval": 65535, "row": 2},
-        {"x": 16.25, "y": 2.5, "label": "End", "keyval": 65367, "row": 2},
-        {"x": 17.25, "y": 2.5, "label": "PD", "keyval": 65366, "row": 2},
-        # === Caps row ===
-        {
-            "x": 0,
-            "y": 3.5,
-            "width": 1.75,
-            "label": "Caps",
-            "keyval": 65509,
-            "row": 3,
-            "modifier": True,
-        },
-        {"x": 1.75, "y": 3.5, "label": "A", "keyval": 97, "row": 3},
-        {"x": 2.75, "y": 3.5, "label": "S", "keyval": 115, "row": 3},
-        {"x": 3.75, "y": 3.5, "label": "D", "keyval": 100, "row": 3},
-        {"x": 4.75, "y": 3.5, "label": "F", "keyval": 102, "row": 3},
-        {"x": 5.75, "y": 3.5, "label": "G", "keyval": 103, "row": 3},
-        {"x": 6.75, "y": 3.5, "label": "H", "keyval": 104, "row": 3},
-        {"x": 7.75, "y": 3.5, "label": "J", "keyval": 106, "row": 3},
-        {"x": 8.75, "y": 3.5, "label": "K", "keyval": 107, "row": 3},
-        {"x": 9.75, "y": 3.5, "label": "L", "keyval": 108, "row": 3},
-        {"x": 10.75, "y": 3.5, "label": ";", "secondary": ":", "keyval": 59, "row": 3},
-        {"x": 11.75, "y": 3.5, "label": "'", "secondary": '"', "keyval": 39, "row": 3},
-        {
-            "x": 12.75,
-            "y": 3.5,
-            "width": 2.25,
-            "label": "Enter",
-            "keyval": 65293,
-            "row": 3,
-            "special": True,
-        },
-        # === Shift row ===
-        {
-            "x": 0,
-            "y": 4.5,
-            "width": 2.25,
-            "label": "Shift",
-            "keyval": 65505,
-            "row": 4,
-            "modifier": True,
-        },
-        {"x": 2.25, "y": 4.5, "label": "Z", "keyval": 122, "row": 4},
-        {"x": 3.25, "y": 4.5, "label": "X", "keyval": 120, "row": 4},
-        {"x": 4.25, "y": 4.5, "label": "C", "keyval": 99, "row": 4},
-        {"x": 5.25, "y": 4.5, "label": "V", "keyval": 118, "row": 4},
-        {"x": 6.25, "y": 4.5, "label": "B", "keyval": 98, "row": 4},
-        {"x": 7.25, "y": 4.5, "label": "N", "keyval": 110, "row": 4},
-        {"x": 8.25, "y": 4.5, "label": "M", "keyval": 109, "row": 4},
-        {"x": 9.25, "y": 4.5, "label": ",", "secondary": "<", "keyval": 44, "row": 4},
-        {"x": 10.25, "y": 4.5, "label": ".", "secondary": ">", "keyval": 46, "row": 4},
-        {"x": 11.25, "y": 4.5, "label": "/", "secondary": "?", "keyval": 47, "row": 4},
-        {
-            "x": 12.25,
-            "y": 4.5,
-            "width": 2.75,
-            "label": "Shift",
-            "keyval": 65506,
-            "row": 4,
-            "modifier": True,
-        },
-        # Arrow up
-        {"x": 16.25, "y": 4.5, "label": "^", "keyval": 65362, "row": 4},
-        # === Bottom row ===
-        {
-            "x": 0,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Ctrl",
-            "keyval": 65507,
-            "row": 5,
-            "modifier": True,
-        },
-        {
-            "x": 1.25,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Super",
-            "keyval": 65515,
-            "row": 5,
-            "modifier": True,
-        },
-        {
-            "x": 2.5,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Alt",
-            "keyval": 65513,
-            "row": 5,
-            "modifier": True,
-        },
-        {"x": 3.75, "y": 5.5, "width": 6.25, "label": "", "keyval": 32, "row": 5},
-        {
-            "x": 10,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Alt",
-            "keyval": 65514,
-            "row": 5,
-            "modifier": True,
-        },
-        {
-            "x": 11.25,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Super",
-            "keyval": 65516,
-            "row": 5,
-            "modifier": True,
-        },
-        {"x": 12.5, "y": 5.5, "width": 1.25, "label": "Menu", "keyval": 65383, "row": 5},
-        {
-            "x": 13.75,
-            "y": 5.5,
-            "width": 1.25,
-            "label": "Ctrl",
-            "keyval": 65508,
-            "row": 5,
-            "modifier": True,
-        },
-        # Arrows
-        {"x": 15.25, "y": 5.5, "label": "<", "keyval": 65361, "row": 5},
-        {"x": 16.25, "y": 5.5, "label": "v", "keyval": 65364, "row": 5},
-        {"x": 17.25, "y": 5.5, "label": ">", "keyval": 65363, "row": 5},
+        *_ANSI_FUNCTION_ROW,
+        _ANSI_GRAVE_KEY,
+        *_ANSI_ALPHA_ROWS,
+        *_ANSI_BOTTOM_ROW,
+        *_ANSI_NAV_CLUSTER,
+        *_ANSI_ARROWS,
     ],
 }
 
@@ -473,152 +301,8 @@ ANSI_60_DATA = {
     "width": 15,
     "height": 5,
     "keys": [
-        # === Number row ===
         {"x": 0, "y": 0, "label": "Esc", "keyval": 65307, "row": 0},
-        {"x": 1, "y": 0, "label": "1", "secondary": "!", "keyval": 49, "row": 0},
-        {"x": 2, "y": 0, "label": "2", "secondary": "@", "keyval": 50, "row": 0},
-        {"x": 3, "y": 0, "label": "3", "secondary": "#", "keyval": 51, "row": 0},
-        {"x": 4, "y": 0, "label": "4", "secondary": "$", "keyval": 52, "row": 0},
-        {"x": 5, "y": 0, "label": "5", "secondary": "%", "keyval": 53, "row": 0},
-        {"x": 6, "y": 0, "label": "6", "secondary": "^", "keyval": 54, "row": 0},
-        {"x": 7, "y": 0, "label": "7", "secondary": "&", "keyval": 55, "row": 0},
-        {"x": 8, "y": 0, "label": "8", "secondary": "*", "keyval": 56, "row": 0},
-        {"x": 9, "y": 0, "label": "9", "secondary": "(", "keyval": 57, "row": 0},
-        {"x": 10, "y": 0, "label": "0", "secondary": ")", "keyval": 48, "row": 0},
-        {"x": 11, "y": 0, "label": "-", "secondary": "_", "keyval": 45, "row": 0},
-        {"x": 12, "y": 0, "label": "=", "secondary": "+", "keyval": 61, "row": 0},
-        {"x": 13, "y": 0, "width": 2, "label": "Bksp", "keyval": 65288, "row": 0, "special": True},
-        # === Tab row ===
-        {"x": 0, "y": 1, "width": 1.5, "label": "Tab", "keyval": 65289, "row": 1, "special": True},
-        {"x": 1.5, "y": 1, "label": "Q", "keyval": 113, "row": 1},
-        {"x": 2.5, "y": 1, "label": "W", "keyval": 119, "row": 1},
-        {"x": 3.5, "y": 1, "label": "E", "keyval": 101, "row": 1},
-        {"x": 4.5, "y": 1, "label": "R", "keyval": 114, "row": 1},
-        {"x": 5.5, "y": 1, "label": "T", "keyval": 116, "row": 1},
-        {"x": 6.5, "y": 1, "label": "Y", "keyval": 121, "row": 1},
-        {"x": 7.5, "y": 1, "label": "U", "keyval": 117, "row": 1},
-        {"x": 8.5, "y": 1, "label": "I", "keyval": 105, "row": 1},
-        {"x": 9.5, "y": 1, "label": "O", "keyval": 111, "row": 1},
-        {"x": 10.5, "y": 1, "label": "P", "keyval": 112, "row": 1},
-        {"x": 11.5, "y": 1, "label": "[", "secondary": "{", "keyval": 91, "row": 1},
-        {"x": 12.5, "y": 1, "label": "]", "secondary": "}", "keyval": 93, "row": 1},
-        {"x": 13.5, "y": 1, "width": 1.5, "label": "\\", "secondary": "|", "keyval": 92, "row": 1},
-        # === Caps row ===
-        {
-            "x": 0,
-            "y": 2,
-            "width": 1.75,
-            "label": "Caps",
-            "keyval": 65509,
-            "row": 2,
-            "modifier": True,
-        },
-        {"x": 1.75, "y": 2, "label": "A", "keyval": 97, "row": 2},
-        {"x": 2.75, "y": 2, "label": "S", "keyval": 115, "row": 2},
-        {"x": 3.75, "y": 2, "label": "D", "keyval": 100, "row": 2},
-        {"x": 4.75, "y": 2, "label": "F", "keyval": 102, "row": 2},
-        {"x": 5.75, "y": 2, "label": "G", "keyval": 103, "row": 2},
-        {"x": 6.75, "y": 2, "label": "H", "keyval": 104, "row": 2},
-        {"x": 7.75, "y": 2, "label": "J", "keyval": 106, "row": 2},
-        {"x": 8.75, "y": 2, "label": "K", "keyval": 107, "row": 2},
-        {"x": 9.75, "y": 2, "label": "L", "keyval": 108, "row": 2},
-        {"x": 10.75, "y": 2, "label": ";", "secondary": ":", "keyval": 59, "row": 2},
-        {"x": 11.75, "y": 2, "label": "'", "secondary": '"', "keyval": 39, "row": 2},
-        {
-            "x": 12.75,
-            "y": 2,
-            "width": 2.25,
-            "label": "Enter",
-            "keyval": 65293,
-            "row": 2,
-            "special": True,
-        },
-        # === Shift row ===
-        {
-            "x": 0,
-            "y": 3,
-            "width": 2.25,
-            "label": "Shift",
-            "keyval": 65505,
-            "row": 3,
-            "modifier": True,
-        },
-        {"x": 2.25, "y": 3, "label": "Z", "keyval": 122, "row": 3},
-        {"x": 3.25, "y": 3, "label": "X", "keyval": 120, "row": 3},
-        {"x": 4.25, "y": 3, "label": "C", "keyval": 99, "row": 3},
-        {"x": 5.25, "y": 3, "label": "V", "keyval": 118, "row": 3},
-        {"x": 6.25, "y": 3, "label": "B", "keyval": 98, "row": 3},
-        {"x": 7.25, "y": 3, "label": "N", "keyval": 110, "row": 3},
-        {"x": 8.25, "y": 3, "label": "M", "keyval": 109, "row": 3},
-        {"x": 9.25, "y": 3, "label": ",", "secondary": "<", "keyval": 44, "row": 3},
-        {"x": 10.25, "y": 3, "label": ".", "secondary": ">", "keyval": 46, "row": 3},
-        {"x": 11.25, "y": 3, "label": "/", "secondary": "?", "keyval": 47, "row": 3},
-        {
-            "x": 12.25,
-            "y": 3,
-            "width": 2.75,
-            "label": "Shift",
-            "keyval": 65506,
-            "row": 3,
-            "modifier": True,
-        },
-        # === Bottom row ===
-        {
-            "x": 0,
-            "y": 4,
-            "width": 1.25,
-            "label": "Ctrl",
-            "keyval": 65507,
-            "row": 4,
-            "modifier": True,
-        },
-        {
-            "x": 1.25,
-            "y": 4,
-            "width": 1.25,
-            "label": "Super",
-            "keyval": 65515,
-            "row": 4,
-            "modifier": True,
-        },
-        {
-            "x": 2.5,
-            "y": 4,
-            "width": 1.25,
-            "label": "Alt",
-            "keyval": 65513,
-            "row": 4,
-            "modifier": True,
-        },
-        {"x": 3.75, "y": 4, "width": 6.25, "label": "", "keyval": 32, "row": 4},
-        {
-            "x": 10,
-            "y": 4,
-            "width": 1.25,
-            "label": "Alt",
-            "keyval": 65514,
-            "row": 4,
-            "modifier": True,
-        },
-        {
-            "x": 11.25,
-            "y": 4,
-            "width": 1.25,
-            "label": "Super",
-            "keyval": 65516,
-            "row": 4,
-            "modifier": True,
-        },
-        {"x": 12.5, "y": 4, "width": 1.25, "label": "Menu", "keyval": 65383, "row": 4},
-        {
-            "x": 13.75,
-            "y": 4,
-            "width": 1.25,
-            "label": "Ctrl",
-            "keyval": 65508,
-            "row": 4,
-            "modifier": True,
-        },
+        *_without_function_row(_ANSI_ALPHA_ROWS + _ANSI_BOTTOM_ROW),
     ],
 }
 
@@ -793,6 +477,9 @@ MAC_LAYOUT_DATA = {
     ],
 }
 
+# Parsed layouts by id; the data above is static, so each is parsed once per process
+_PARSED_LAYOUTS: dict[str, KeyboardLayout] = {}
+
 
 class KeyboardView(Gtk.DrawingArea):
     """Visual keyboard display with Cairo rendering."""
@@ -883,7 +570,11 @@ class KeyboardView(Gtk.DrawingArea):
             # Default to TKL for unknown types (ISO, etc.)
             layout_data = ANSI_87_DATA
 
-        return self._parse_layout_data(layout_data)
+        layout = _PARSED_LAYOUTS.get(layout_data["id"])
+        if layout is None:
+            layout = self._parse_layout_data(layout_data)
+            _PARSED_LAYOUTS[layout_data["id"]] = layout
+        return layout
 
     def _parse_layout_data(self, layout_data: dict) -> KeyboardLayout:
         """Parse layout data dictionary into KeyboardLayout."""
@@ -949,25 +640,26 @@ class KeyboardView(Gtk.DrawingArea):
         key_radius = 5 * scale
         shadow_offset = 2 * scale
 
-        # First pass: draw shadows for 3D effect
-        for key in self._layout.keys:
-            x = offset_x + key.x * unit + key_margin
-            y = offset_y + key.y * unit + key_margin
-            w = key.width * unit - 2 * key_margin
-            h = key.height * unit - 2 * key_margin
+        # Key rectangles in widget pixels, computed once for both passes
+        rects = [
+            (
+                key,
+                offset_x + key.x * unit + key_margin,
+                offset_y + key.y * unit + key_margin,
+                key.width * unit - 2 * key_margin,
+                key.height * unit - 2 * key_margin,
+            )
+            for key in self._layout.keys
+        ]
 
-            # Draw shadow
-            cr.set_source_rgba(*self._key_shadow_color)
+        # First pass: draw shadows for 3D effect (one fill for all keys)
+        cr.set_source_rgba(*self._key_shadow_color)
+        for _key, x, y, w, h in rects:
             self._draw_rounded_rect(cr, x + shadow_offset, y + shadow_offset, w, h, key_radius)
-            cr.fill()
+        cr.fill()
 
         # Second pass: draw keys
-        for key in self._layout.keys:
-            x = offset_x + key.x * unit + key_margin
-            y = offset_y + key.y * unit + key_margin
-            w = key.width * unit - 2 * key_margin
-            h = key.height * unit - 2 * key_margin
-
+        for key, x, y, w, h in rects:
             # Determine key color
             if key == self._hover_key:
                 color = self._key_hover_color
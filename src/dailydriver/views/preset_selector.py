@@ -21,10 +21,14 @@ class PresetSelector(Adw.Dialog):
         ),
     }
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        gsettings_service: GSettingsService | None = None,
+        profile_service: ProfileService | None = None,
+    ) -> None:
         super().__init__()
-        self._gsettings_service = GSettingsService()
-        self._profile_service = ProfileService(self._gsettings_service)
+        self._gsettings_service = gsettings_service or GSettingsService()
+        self._profile_service = profile_service or ProfileService(self._gsettings_service)
         self._presets: list[Profile] = []
         self._selected_preset: Profile | None = None
 
@@ -255,14 +259,19 @@ class PresetSelector(Adw.Dialog):
         button.set_label("Applying...")
 
         def apply():
+            # The shared services' caches and Settings objects belong to the main
+            # thread, so the worker writes through private instances
+            gsettings_service = GSettingsService()
+            profile_service = ProfileService(gsettings_service)
+
             # Apply workspace changes first
             if setup_hyprland_workspaces:
-                self._gsettings_service.setup_workspaces_for_hyprland()
+                gsettings_service.setup_workspaces_for_hyprland()
             elif restore_workspaces:
-                self._gsettings_service.restore_default_workspaces()
+                gsettings_service.restore_default_workspaces()
 
             # Apply the profile shortcuts
-            changed = self._profile_service.apply_profile(self._selected_preset)
+            changed = profile_service.apply_profile(self._selected_preset)
             GLib.idle_add(self._on_apply_complete, changed)
 
         GLib.Thread.new("apply-preset", apply)
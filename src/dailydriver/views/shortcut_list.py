@@ -7,7 +7,7 @@ from pathlib import Path
 
 from gi.repository import Adw, GObject, Gtk
 
-from dailydriver.models import Shortcut, ShortcutCategory
+from dailydriver.models import Shortcut, ShortcutCategory, normalize_accelerator
 
 try:
     import tomllib
@@ -16,14 +16,6 @@ except ImportError:
 
 
 # Load preset data for modification comparison
-def _normalize_accelerator(accel: str) -> str:
-    """Normalize accelerator string through GTK parsing."""
-    from dailydriver.models import KeyBinding
-
-    binding = KeyBinding.from_accelerator(accel)
-    return binding.to_accelerator() if binding else accel
-
-
 def _load_preset_shortcuts(preset_name: str) -> dict[str, set[str]]:
     """Load shortcuts from a preset file, normalized for comparison."""
     preset_path = Path(__file__).parent.parent / "resources" / "presets" / f"{preset_name}.toml"
@@ -35,7 +27,7 @@ def _load_preset_shortcuts(preset_name: str) -> dict[str, set[str]]:
         shortcuts = data.get("shortcuts", {})
         # Normalize accelerators for consistent comparison
         return {
-            key: set(_normalize_accelerator(a) for a in accels) for key, accels in shortcuts.items()
+            key: set(normalize_accelerator(a) for a in accels) for key, accels in shortcuts.items()
         }
     except Exception:
         return {}
@@ -47,12 +39,16 @@ _GNOME_TILING_SHORTCUTS = _load_preset_shortcuts("gnome-tiling")
 _HYPRLAND_SHORTCUTS = _load_preset_shortcuts("hyprland-style")
 
 
+# Splits text into alternating non-digit / digit runs for natural sorting
+_SPLIT_DIGITS = re.compile(r"(\d+)")
+
+
 def natural_sort_key(s: str) -> list:
     """Sort strings with embedded numbers naturally.
 
     "Layout 2" comes before "Layout 10", not after.
     """
-    return [int(text) if text.isdigit() else text.lower() for text in re.split(r"(\d+)", s)]
+    return [int(text) if text.isdigit() else text.lower() for text in _SPLIT_DIGITS.split(s)]
 
 
 class ShortcutRow(Adw.ActionRow):
@@ -195,6 +191,8 @@ GROUP_ORDER = [
     # Catchall
     "Other",
 ]
+# Position of each group in GROUP_ORDER, for O(1) sort keys
+_GROUP_RANK = {name: i for i, name in enumerate(GROUP_ORDER)}
 
 # Concise descriptions for each group
 GROUP_DESCRIPTIONS = {
@@ -281,10 +279,7 @@ class ShortcutListView(Gtk.Box):
 
         # Sort groups by predefined order
         def group_sort_key(group_name: str) -> int:
-            try:
-                return GROUP_ORDER.index(group_name)
-            except ValueError:
-                return len(GROUP_ORDER)  # Unknown groups go last
+            return _GROUP_RANK.get(group_name, len(_GROUP_RANK))  # Unknown groups go last
 
         sorted_groups = sorted(groups.keys(), key=group_sort_key)
 
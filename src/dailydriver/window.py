@@ -1,20 +1,38 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 """Main application window."""
 
+from collections import defaultdict
 from pathlib import Path
 
 from gi.repository import Adw, Gio, GLib, Gtk
 
-from dailydriver.models import Shortcut, ShortcutCategory
+from dailydriver.models import FnMode, MacKeyboardConfig, Shortcut, ShortcutCategory
 from dailydriver.services.gsettings_service import GSettingsService
 from dailydriver.services.hardware_service import HardwareService
+from dailydriver.services.hid_apple_service import HidAppleService
 from dailydriver.services.keyboard_config_service import CapsLockBehavior, KeyboardConfigService
-from dailydriver.views.cheatsheet import CheatSheetView
+from dailydriver.services.profile_service import ProfileService
+from dailydriver.views.cheatsheet import _TILING_GROUPS, CheatSheetView
 from dailydriver.views.keyboard_view import KeyboardView
 from dailydriver.views.preset_selector import PresetSelector
 from dailydriver.views.shortcut_editor import ShortcutEditorDialog
 from dailydriver.views.shortcut_list import ShortcutListView
 
+# Display names for the bundled presets
+_PRESET_NAMES = {
+    "vanilla-gnome": "Vanilla GNOME",
+    "gnome-tiling": "GNOME + Tiling",
+    "hyprland-style": "Hyprland Style",
+}
+
+# Caps Lock radio keys and the behaviors they select
+_CAPS_BEHAVIORS = {
+    "caps": CapsLockBehavior.CAPS_LOCK,
+    "escape": CapsLockBehavior.ESCAPE,
+    "ctrl": CapsLockBehavior.CTRL,
+}
+_CAPS_KEYS = {behavior: key for key, behavior in _CAPS_BEHAVIORS.items()}
+
 
 class DailyDriverWindow(Adw.ApplicationWindow):
     """Main application window."""
@@ -26,14 +44,22 @@ class DailyDriverWindow(Adw.ApplicationWindow):
 
         # Initialize services
         self._gsettings_service = GSettingsService()
+        # Shared so its parsed-profile cache survives between handlers
+        self._profile_service = ProfileService(self._gsettings_service)
         self._hardware = HardwareService()
+        self._hid_apple = HidAppleService()
         self._kbd_config = KeyboardConfigService()
         self._shortcuts: dict[str, Shortcut] = {}
         self._shortcut_views: dict[str, ShortcutListView] = {}
         self._current_category: str | None = None
         self._loading = True
+        # Radio selections, reverted to when a change fails; set for real once
+        # _apply_config_state has read the system state
+        self._current_layout = "pc"
+        self._current_caps = "caps"
         self._tiling_enabled = True
         self._show_unbound = False
+        self._reload_source = 0  # Pending idle reload, 0 when none
 
         # Detect keyboard
         self._detected_keyboard = self._detect_keyboard()
@@ -54,22 +80,24 @@ class DailyDriverWindow(Adw.ApplicationWindow):
 
         # Load shortcuts (uses tiling/unbound settings)
         GLib.idle_add(self._load_shortcuts)
-        GLib.idle_add(self._load_config_state)
+        # Config radios only mirror system state; let the first frame paint first
+        GLib.idle_add(self._load_config_state, priority=GLib.PRIORITY_LOW)
 
     def _detect_keyboard(self):
-        """Detect connected keyboard."""
-        keyboards = list(self._hardware.list_keyboards())
-        mac_kbs = [kb for kb in keyboards if kb.is_mac]
-        external_kbs = [kb for kb in keyboards if not kb.is_internal]
-        internal_kbs = [kb for kb in keyboards if kb.is_internal]
-
-        if mac_kbs:
-            return mac_kbs[0]
-        elif external_kbs:
-            return external_kbs[0]
-        elif internal_kbs:
-            return internal_kbs[0]
-        return None
+        """Detect connected keyboard.
+
+        Prefers the first Mac keyboard, then the first external one, then
+        the first internal one.
+        """
+        best = None
+        best_rank = 3
+        for kb in self._hardware.list_keyboards():
+            rank = 0 if kb.is_mac else 2 if kb.is_internal else 1
+            if rank < best_rank:
+                best, best_rank = kb, rank
+                if rank == 0:
+                    break
+        return best
 
     def _build_ui(self) -> None:
         """Build the UI."""
@@ -114,7 +142,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         )
 
         # === CHEAT SHEET VIEW ===
-        self._cheatsheet_view = CheatSheetView()
+        self._cheatsheet_view = CheatSheetView(self._gsettings_service)
         self._view_stack.add_titled_with_icon(
             self._cheatsheet_view, "cheatsheet", "Cheat Sheet", "accessories-dictionary-symbolic"
         )
@@ -150,13 +178,14 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         sidebar_scroll.set_child(sidebar_content)
 
         # --- Categories Section ---
-        cat_header = Gtk.Label(label="Categories")
-        cat_header.add_css_class("heading")
-        cat_header.add_css_class("dim-label")
-        cat_header.set_xalign(0)
-        cat_header.set_margin_start(12)
-        cat_header.set_margin_top(8)
-        cat_header.set_margin_bottom(4)
+        cat_header = Gtk.Label(
+            label="Categories",
+            xalign=0,
+            css_classes=["heading", "dim-label"],
+            margin_start=12,
+            margin_top=8,
+            margin_bottom=4,
+        )
         sidebar_content.append(cat_header)
 
         self.category_list = Gtk.ListBox()
@@ -166,18 +195,17 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         sidebar_content.append(self.category_list)
 
         # Separator
-        sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
-        sep.set_margin_top(12)
-        sep.set_margin_bottom(8)
+        sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL, margin_top=12, margin_bottom=8)
         sidebar_content.append(sep)
 
         # --- Settings Section Header ---
-        settings_header = Gtk.Label(label="Settings")
-        settings_header.add_css_class("heading")
-        settings_header.add_css_class("dim-label")
-        settings_header.set_xalign(0)
-        settings_header.set_margin_start(12)
-        settings_header.set_margin_bottom(4)
+        settings_header = Gtk.Label(
+            label="Settings",
+            xalign=0,
+            css_classes=["heading", "dim-label"],
+            margin_start=12,
+            margin_bottom=4,
+        )
         sidebar_content.append(settings_header)
 
         # --- Configuration Section ---
@@ -217,16 +245,17 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         self.keyboard_revealer.set_reveal_child(False)
         self.keyboard_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_DOWN)
 
-        keyboard_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        keyboard_container.set_margin_start(12)
-        keyboard_container.set_margin_end(12)
-        keyboard_container.set_margin_top(12)
-        keyboard_container.set_margin_bottom(12)
+        keyboard_container = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            margin_start=12,
+            margin_end=12,
+            margin_top=12,
+            margin_bottom=12,
+        )
 
         # Use detected keyboard type
-        kbd_type = None
-        if self._detected_keyboard:
-            kbd_type = self._detected_keyboard.suggested_layout()
+        kb = self._detected_keyboard
+        kbd_type = kb.suggested_layout() if kb else None
         self._keyboard_view = KeyboardView(keyboard_type=kbd_type)
         self._keyboard_view.set_size_request(-1, 200)
         keyboard_container.append(self._keyboard_view)
@@ -239,12 +268,9 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         shortcuts_scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         shortcuts_scroll.set_vexpand(True)
 
-        clamp = Adw.Clamp()
-        clamp.set_maximum_size(800)
-        clamp.set_margin_start(12)
-        clamp.set_margin_end(12)
-        clamp.set_margin_top(12)
-        clamp.set_margin_bottom(12)
+        clamp = Adw.Clamp(
+            maximum_size=800, margin_start=12, margin_end=12, margin_top=12, margin_bottom=12
+        )
 
         self.shortcuts_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=24)
         clamp.set_child(self.shortcuts_container)
@@ -258,14 +284,16 @@ class DailyDriverWindow(Adw.ApplicationWindow):
 
     def _build_config_section(self) -> Gtk.Widget:
         """Build the configuration options section with radio buttons."""
-        config_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        config_box.set_margin_start(12)
-        config_box.set_margin_end(12)
-        config_box.set_margin_top(8)
+        config_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=16,
+            margin_start=12,
+            margin_end=12,
+            margin_top=8,
+        )
 
         # --- Keyboard & Preset Header (orange/accent) ---
-        header_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        header_box.set_margin_bottom(8)
+        header_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2, margin_bottom=8)
 
         # Keyboard info row
         kbd_info = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
@@ -276,10 +304,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         kbd_name = (
             self._detected_keyboard.display_name if self._detected_keyboard else "Standard Keyboard"
         )
-        kbd_label = Gtk.Label(label=kbd_name)
-        kbd_label.add_css_class("dim-label")
-        kbd_label.set_xalign(0)
-        kbd_label.set_hexpand(True)
+        kbd_label = Gtk.Label(label=kbd_name, xalign=0, hexpand=True, css_classes=["dim-label"])
         kbd_info.append(kbd_label)
         header_box.append(kbd_info)
 
@@ -289,10 +314,9 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         preset_icon.add_css_class("dim-label")
         preset_info.append(preset_icon)
 
-        self._current_preset_label = Gtk.Label(label="GNOME + Tiling Preset")
-        self._current_preset_label.add_css_class("dim-label")
-        self._current_preset_label.set_xalign(0)
-        self._current_preset_label.set_hexpand(True)
+        self._current_preset_label = Gtk.Label(
+            label="GNOME + Tiling Preset", xalign=0, hexpand=True, css_classes=["dim-label"]
+        )
         preset_info.append(self._current_preset_label)
         header_box.append(preset_info)
 
@@ -302,20 +326,14 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         preset_expander = Gtk.Expander(label="Shortcut Presets")
         preset_expander.set_expanded(False)
 
-        preset_content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        preset_content.set_margin_start(8)
-        preset_content.set_margin_top(4)
+        preset_content = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, spacing=2, margin_start=8, margin_top=4
+        )
 
         # Radio buttons for presets
         self._preset_radios: dict[str, Gtk.CheckButton] = {}
-        preset_options = [
-            ("vanilla-gnome", "Vanilla GNOME"),
-            ("gnome-tiling", "GNOME + Tiling"),
-            ("hyprland-style", "Hyprland Style"),
-        ]
-
         first_radio = None
-        for key, label in preset_options:
+        for key, label in _PRESET_NAMES.items():
             radio = Gtk.CheckButton(label=label)
             if first_radio:
                 radio.set_group(first_radio)
@@ -332,9 +350,9 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         user_expander = Gtk.Expander(label="User Modifications")
         user_expander.set_expanded(False)
 
-        user_content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        user_content.set_margin_start(8)
-        user_content.set_margin_top(4)
+        user_content = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, spacing=4, margin_start=8, margin_top=4
+        )
 
         # Set up launchers button
         launchers_button = Gtk.Button(label="Set Up Launchers")
@@ -343,9 +361,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         user_content.append(launchers_button)
 
         # Separator
-        sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
-        sep.set_margin_top(4)
-        sep.set_margin_bottom(4)
+        sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL, margin_top=4, margin_bottom=4)
         user_content.append(sep)
 
         # Clear user modifications button
@@ -367,9 +383,9 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         layout_expander = Gtk.Expander(label="Keyboard Layout")
         layout_expander.set_expanded(False)
 
-        layout_content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        layout_content.set_margin_start(8)
-        layout_content.set_margin_top(4)
+        layout_content = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, spacing=2, margin_start=8, margin_top=4
+        )
 
         # Radio buttons for layout
         self._layout_radios: dict[str, Gtk.CheckButton] = {}
@@ -393,9 +409,9 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         caps_expander = Gtk.Expander(label="Caps Lock Behavior")
         caps_expander.set_expanded(False)
 
-        caps_content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        caps_content.set_margin_start(8)
-        caps_content.set_margin_top(4)
+        caps_content = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, spacing=2, margin_start=8, margin_top=4
+        )
 
         # Radio buttons for caps lock
         self._caps_radios: dict[str, Gtk.CheckButton] = {}
@@ -425,9 +441,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
 
         unbound_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
 
-        unbound_label = Gtk.Label(label="Show Unbound")
-        unbound_label.set_xalign(0)
-        unbound_label.set_hexpand(True)
+        unbound_label = Gtk.Label(label="Show Unbound", xalign=0, hexpand=True)
         unbound_row.append(unbound_label)
 
         self._unbound_switch = Gtk.Switch()
@@ -437,10 +451,11 @@ class DailyDriverWindow(Adw.ApplicationWindow):
 
         unbound_group.append(unbound_row)
 
-        unbound_desc = Gtk.Label(label="Include shortcuts with no key binding")
-        unbound_desc.add_css_class("dim-label")
-        unbound_desc.add_css_class("caption")
-        unbound_desc.set_xalign(0)
+        unbound_desc = Gtk.Label(
+            label="Include shortcuts with no key binding",
+            xalign=0,
+            css_classes=["dim-label", "caption"],
+        )
         unbound_group.append(unbound_desc)
 
         config_box.append(unbound_group)
@@ -448,68 +463,62 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         return config_box
 
     def _load_config_state(self) -> bool:
-        """Load current config state into radio buttons."""
+        """Load current config state into radio buttons.
+
+        The hid_apple sysfs reads run on a worker thread; the radios are
+        updated from _apply_config_state back on the main loop.
+        """
         self._loading = True
 
-        # Track current state for reverting failed changes
-        self._current_layout = "pc"
-        self._current_caps = "caps"
+        def read_layout():
+            # Layout - check actual system state. get_current_config() is None
+            # when hid_apple isn't loaded, so it covers the module check too.
+            # A private service keeps this thread off the shared one's cache.
+            hid_config = HidAppleService().get_current_config()
+            kb = self._detected_keyboard
+            kb_is_mac = kb is not None and kb.is_mac
 
-        # Layout - check actual system state
-        from dailydriver.services.hid_apple_service import HidAppleService
-
-        hid = HidAppleService()
-
-        if hid.is_module_loaded():
-            hid_config = hid.get_current_config()
-            if (
-                hid_config
-                and hid_config.swap_opt_cmd
-                or self._detected_keyboard
-                and self._detected_keyboard.is_mac
-            ):
-                self._current_layout = "mac"
-        elif self._detected_keyboard and self._detected_keyboard.is_mac:
-            self._current_layout = "mac"
-
-        self._layout_radios[self._current_layout].set_active(True)
-
-        # Caps Lock
-        caps = self._kbd_config.get_caps_lock_behavior()
-        caps_map = {
-            CapsLockBehavior.CAPS_LOCK: "caps",
-            CapsLockBehavior.ESCAPE: "escape",
-            CapsLockBehavior.CTRL: "ctrl",
-        }
-        self._current_caps = caps_map.get(caps, "caps")
-
-        # Check if it's a non-standard config (custom)
-        if caps not in caps_map:
-            self._current_caps = "custom"
+            swapped = hid_config is not None and hid_config.swap_opt_cmd
+            layout = "mac" if swapped or kb_is_mac else "pc"
+            GLib.idle_add(self._apply_config_state, layout)
 
-        self._caps_radios[self._current_caps].set_active(True)
+        GLib.Thread.new("load-config-state", read_layout)
+        return False
 
-        # Tiling - controlled by preset, not manual toggle
-        self._tiling_enabled = self._settings.get_boolean("tiling-enabled")
+    def _apply_config_state(self, layout: str) -> bool:
+        """Reflect the detected layout and current settings in the config radios."""
+        # Another handler may have cleared the flag since _load_config_state set
+        # it; keep these programmatic set_active() calls from applying changes
+        self._loading = True
+        try:
+            # Track current state for reverting failed changes
+            self._current_layout = layout
 
-        # Restore selected preset radio button
-        current_preset = self._settings.get_string("current-preset")
-        if current_preset and current_preset in self._preset_radios:
-            self._preset_radios[current_preset].set_active(True)
-            preset_names = {
-                "vanilla-gnome": "Vanilla GNOME",
-                "gnome-tiling": "GNOME + Tiling",
-                "hyprland-style": "Hyprland Style",
-            }
-            self._current_preset_label.set_label(
-                f"{preset_names.get(current_preset, current_preset)} Preset"
-            )
-
-        # Show unbound
-        self._show_unbound = self._settings.get_boolean("show-unbound")
-        self._unbound_switch.set_active(self._show_unbound)
+            self._layout_radios[self._current_layout].set_active(True)
+
+            # Caps Lock
+            caps = self._kbd_config.get_caps_lock_behavior()
+            # Anything non-standard is shown as custom
+            self._current_caps = _CAPS_KEYS.get(caps, "custom")
+
+            self._caps_radios[self._current_caps].set_active(True)
 
-        self._loading = False
+            # Tiling - controlled by preset, not manual toggle
+            self._tiling_enabled = self._settings.get_boolean("tiling-enabled")
+
+            # Restore selected preset radio button
+            current_preset = self._settings.get_string("current-preset")
+            if current_preset and current_preset in self._preset_radios:
+                self._preset_radios[current_preset].set_active(True)
+                self._current_preset_label.set_label(
+                    f"{_PRESET_NAMES.get(current_preset, current_preset)} Preset"
+                )
+
+            # Show unbound
+            self._show_unbound = self._settings.get_boolean("show-unbound")
+            self._unbound_switch.set_active(self._show_unbound)
+        finally:
+            self._loading = False
         return False
 
     def _on_unbound_toggled(self, switch: Gtk.Switch, param) -> None:
@@ -521,7 +530,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         self._settings.set_boolean("show-unbound", self._show_unbound)
 
         # Reload shortcuts to show/hide unbound
-        self._reload_shortcuts()
+        self._queue_reload_shortcuts()
 
     def _on_layout_toggled(self, radio: Gtk.CheckButton, key: str) -> None:
         """Handle layout radio toggle."""
@@ -534,10 +543,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
             self._show_toast("Using custom layout")
             return
 
-        from dailydriver.models import FnMode, MacKeyboardConfig
-        from dailydriver.services.hid_apple_service import HidAppleService
-
-        hid = HidAppleService()
+        hid = self._hid_apple
         if not hid.is_module_loaded():
             self._current_layout = key
             self._show_toast("Layout updated (no Mac keyboard)")
@@ -572,13 +578,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
             self._show_toast("Using custom caps lock")
             return
 
-        caps_map = {
-            "caps": CapsLockBehavior.CAPS_LOCK,
-            "escape": CapsLockBehavior.ESCAPE,
-            "ctrl": CapsLockBehavior.CTRL,
-        }
-
-        behavior = caps_map.get(key, CapsLockBehavior.CAPS_LOCK)
+        behavior = _CAPS_BEHAVIORS.get(key, CapsLockBehavior.CAPS_LOCK)
         success = self._kbd_config.set_caps_lock_behavior(behavior)
 
         if success:
@@ -673,6 +673,16 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         self._settings.set_boolean("window-maximized", self.is_maximized())
         return False
 
+    def _queue_reload_shortcuts(self) -> None:
+        """Reload shortcuts on the next idle, coalescing repeated requests."""
+        if not self._reload_source:
+            self._reload_source = GLib.idle_add(self._flush_reload_shortcuts)
+
+    def _flush_reload_shortcuts(self) -> bool:
+        """Run a queued shortcut reload."""
+        self._reload_source = 0
+        return self._reload_shortcuts()
+
     def _reload_shortcuts(self) -> bool:
         """Reload shortcuts after configuration change."""
         self._shortcut_views.clear()
@@ -687,7 +697,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         self._load_shortcuts()
 
         # Refresh cheat sheet
-        self._cheatsheet_view.refresh()
+        self._cheatsheet_view.refresh(self._shortcuts)
 
         return False
 
@@ -696,22 +706,24 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         self._shortcuts = self._gsettings_service.load_all_shortcuts()
         all_categories = self._gsettings_service.get_categories()
 
-        # Tiling-related groups to hide when tiling disabled
-        tiling_groups = {"Tile Halves", "Tile Quarters", "Tile Actions", "Layouts"}
-
         # Filter categories based on tiling setting
         categories = [c for c in all_categories if self._tiling_enabled or c.id != "tiling"]
 
+        # Bucket visible shortcuts by category in a single pass
+        hidden_groups = frozenset() if self._tiling_enabled else _TILING_GROUPS
+        show_unbound = self._show_unbound
+        by_category: dict[str, list[Shortcut]] = defaultdict(list)
+        for s in self._shortcuts.values():
+            if s.group in hidden_groups:
+                continue
+            if not (show_unbound or s.bindings):  # Filter unbound
+                continue
+            by_category[s.category].append(s)
+
         # Build shortcut views and track which categories have visible shortcuts
         visible_categories = []
         for category in categories:
-            category_shortcuts = [
-                s
-                for s in self._shortcuts.values()
-                if s.category == category.id
-                and (self._tiling_enabled or s.group not in tiling_groups)
-                and (self._show_unbound or s.bindings)  # Filter unbound
-            ]
+            category_shortcuts = by_category.get(category.id)
             if category_shortcuts:
                 view = ShortcutListView(category, category_shortcuts)
                 view.connect("shortcut-edit-requested", self._on_shortcut_edit)
@@ -763,19 +775,20 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         row = Gtk.ListBoxRow()
         row.category_id = category.id
 
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.add_css_class("category-row")
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        box.set_margin_top(8)
-        box.set_margin_bottom(8)
+        box = Gtk.Box(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            spacing=12,
+            css_classes=["category-row"],
+            margin_start=12,
+            margin_end=12,
+            margin_top=8,
+            margin_bottom=8,
+        )
 
         icon = Gtk.Image.new_from_icon_name(category.icon)
         box.append(icon)
 
-        label = Gtk.Label(label=category.name)
-        label.set_xalign(0)
-        label.set_hexpand(True)
+        label = Gtk.Label(label=category.name, xalign=0, hexpand=True)
         box.append(label)
 
         if count > 0:
@@ -821,7 +834,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
             self._shortcut_views[shortcut.category].update_shortcut(shortcut)
 
         self._keyboard_view.highlight_shortcut(shortcut)
-        self._cheatsheet_view.refresh()
+        self._cheatsheet_view.refresh(self._shortcuts)
 
         toast = Adw.Toast(title=f"Shortcut updated: {shortcut.name}")
         self.toast_overlay.add_toast(toast)
@@ -841,12 +854,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
             return
 
         # Get display name
-        preset_names = {
-            "vanilla-gnome": "Vanilla GNOME",
-            "gnome-tiling": "GNOME + Tiling",
-            "hyprland-style": "Hyprland Style",
-        }
-        display_name = preset_names.get(preset_key, preset_key)
+        display_name = _PRESET_NAMES.get(preset_key, preset_key)
 
         # Get old preset to know what to reset
         old_preset_key = self._settings.get_string("current-preset")
@@ -857,21 +865,22 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         self._settings.set_string("current-preset", preset_key)
 
         # Apply the preset (with cleanup of old preset shortcuts)
-        from dailydriver.services.profile_service import ProfileService
-
-        profile_service = ProfileService(self._gsettings_service)
-        profile = profile_service.get_profile(preset_key)
+        profile = self._profile_service.get_profile(preset_key)
 
         if profile:
+            current_shortcuts = self._gsettings_service.load_all_shortcuts()
+
             # Reset shortcuts from old preset that aren't in new preset
             if old_preset_key and old_preset_key != preset_key:
-                old_profile = profile_service.get_profile(old_preset_key)
+                old_profile = self._profile_service.get_profile(old_preset_key)
                 if old_profile:
-                    profile_service.reset_orphaned_shortcuts(old_profile, profile)
+                    self._profile_service.reset_orphaned_shortcuts(
+                        old_profile, profile, current_shortcuts
+                    )
 
-            profile_service.apply_profile(profile)
+            self._profile_service.apply_profile(profile, current_shortcuts=current_shortcuts)
             self._current_preset_label.set_label(f"{display_name} Preset")
-            self._reload_shortcuts()
+            self._queue_reload_shortcuts()
             toast = Adw.Toast(title=f"Applied: {display_name}")
             self.toast_overlay.add_toast(toast)
         else:
@@ -879,7 +888,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
 
     def _show_preset_selector(self) -> None:
         """Show the preset selector dialog."""
-        dialog = PresetSelector()
+        dialog = PresetSelector(self._gsettings_service, self._profile_service)
         dialog.connect("preset-applied", self._on_preset_applied)
         dialog.present(self)
 
@@ -894,29 +903,21 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         self._settings.set_string("current-preset", preset_name)
 
         # Reset orphaned shortcuts from old preset
-        from dailydriver.services.profile_service import ProfileService
-
-        profile_service = ProfileService(self._gsettings_service)
-
         if old_preset_key and old_preset_key != preset_name:
-            old_profile = profile_service.get_profile(old_preset_key)
-            new_profile = profile_service.get_profile(preset_name)
+            old_profile = self._profile_service.get_profile(old_preset_key)
+            new_profile = self._profile_service.get_profile(preset_name)
             if old_profile and new_profile:
-                profile_service.reset_orphaned_shortcuts(old_profile, new_profile)
+                self._profile_service.reset_orphaned_shortcuts(old_profile, new_profile)
 
-        self._reload_shortcuts()
+        self._queue_reload_shortcuts()
         # Update the radio button and label
         if preset_name in self._preset_radios:
             self._loading = True
             self._preset_radios[preset_name].set_active(True)
             self._loading = False
-        preset_names = {
-            "vanilla-gnome": "Vanilla GNOME",
-            "gnome-tiling": "GNOME + Tiling",
-            "hyprland-style": "Hyprland Style",
-        }
-        self._current_preset_label.set_label(f"{preset_names.get(preset_name, preset_name)} Preset")
-        toast = Adw.Toast(title=f"Applied: {preset_names.get(preset_name, preset_name)}")
+        display_name = _PRESET_NAMES.get(preset_name, preset_name)
+        self._current_preset_label.set_label(f"{display_name} Preset")
+        toast = Adw.Toast(title=f"Applied: {display_name}")
         self.toast_overlay.add_toast(toast)
 
     def _on_import_profile(self, action: Gio.SimpleAction, param: GLib.Variant | None) -> None:
@@ -935,10 +936,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
             current_preset = "gnome-tiling"
 
         # Check if there are any USER modifications (compared to current preset)
-        from dailydriver.services.profile_service import ProfileService
-
-        profile_service = ProfileService(self._gsettings_service)
-        user_mods = profile_service.get_user_modifications(current_preset)
+        user_mods = self._profile_service.get_user_modifications(current_preset)
 
         if not user_mods:
             self._show_toast("No user modifications to clear")
@@ -969,14 +967,10 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         if response != "clear":
             return
 
-        from dailydriver.services.profile_service import ProfileService
-
-        profile_service = ProfileService(self._gsettings_service)
-
-        export_path, num_mods = profile_service.export_and_clear_modifications(preset_name)
+        export_path, num_mods = self._profile_service.export_and_clear_modifications(preset_name)
 
         if export_path:
-            self._reload_shortcuts()
+            self._queue_reload_shortcuts()
             # Show toast with file location
             toast = Adw.Toast(title=f"Saved {num_mods} modification(s) to {export_path.name}")
             toast.set_timeout(5)
@@ -986,12 +980,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
 
     def _get_preset_display_name(self, preset_key: str) -> str:
         """Get display name for a preset key."""
-        preset_names = {
-            "vanilla-gnome": "Vanilla GNOME",
-            "gnome-tiling": "GNOME + Tiling",
-            "hyprland-style": "Hyprland Style",
-        }
-        return preset_names.get(preset_key, preset_key)
+        return _PRESET_NAMES.get(preset_key, preset_key)
 
     def _on_setup_launchers(self, button: Gtk.Button) -> None:
         """Set up default application launchers."""
@@ -1030,7 +1019,7 @@ class DailyDriverWindow(Adw.ApplicationWindow):
         dialog.present(self)
 
         # Reload to show custom shortcuts
-        self._reload_shortcuts()
+        self._queue_reload_shortcuts()
 
     def _on_load_modifications(self, button: Gtk.Button) -> None:
         """Load user modifications from a file."""
@@ -1065,15 +1054,11 @@ class DailyDriverWindow(Adw.ApplicationWindow):
 
             path = Path(file.get_path())
 
-            from dailydriver.services.profile_service import ProfileService
-
-            profile_service = ProfileService(self._gsettings_service)
-
             # Load and apply the profile
-            profile = profile_service.import_profile(path)
-            changed = profile_service.apply_profile(profile)
+            profile = self._profile_service.import_profile(path)
+            changed = self._profile_service.apply_profile(profile)
 
-            self._reload_shortcuts()
+            self._queue_reload_shortcuts()
 
             num_applied = len(changed)
             toast = Adw.Toast(title=f"Applied {num_applied} modification(s) from {path.name}")
@@ -536,6 +536,10 @@ def mock_gi() -> Generator[dict[str, Any], None, None]:
 
     mock_gi_module.repository = mock_repository
 
+    from dailydriver.models.profile import normalize_accelerator
+
+    # Memoized results from another test's Gtk mock must not leak in (or out)
+    normalize_accelerator.cache_clear()
     with patch.dict(
         sys.modules,
         {
@@ -550,6 +554,7 @@ def mock_gi() -> Generator[dict[str, Any], None, None]:
             "Gio": MockGio,
             "GLib": MockGLib,
         }
+    normalize_accelerator.cache_clear()
 
 
 @pytest.fixture
@@ -616,6 +621,8 @@ def create_mock_keyboard(
     id_dir.mkdir()
     (id_dir / "vendor").write_text(f"{vendor_id:04x}\n")
     (id_dir / "product").write_text(f"{product_id:04x}\n")
+    # BUS_BLUETOOTH or BUS_USB
+    (id_dir / "bustype").write_text("0005\n" if is_bluetooth else "0003\n")
 
     # Key capabilities
     caps_dir = device_dir / "capabilities"
@@ -297,6 +297,27 @@ class TestGSettingsServiceInit:
 
             assert result is None
 
+    def test_get_schema_caches_hits_and_misses(self) -> None:
+        """Test that _get_schema looks each schema up once, found or not."""
+        from dailydriver.services.gsettings_service import GSettingsService
+
+        with patch("dailydriver.services.backends.gnome.Gio") as mock_gio:
+            mock_source = MagicMock()
+            mock_schema = MagicMock()
+            mock_source.lookup.side_effect = lambda schema_id, _recursive: (
+                mock_schema if schema_id == "org.gnome.test" else None
+            )
+            mock_gio.SettingsSchemaSource.get_default.return_value = mock_source
+
+            service = GSettingsService()
+
+            assert service._get_schema("org.gnome.test") is mock_schema
+            assert service._get_schema("org.gnome.test") is mock_schema
+            assert service._get_schema("org.nonexistent.schema") is None
+            assert service._get_settings("org.nonexistent.schema") is None
+
+            assert mock_source.lookup.call_count == 2
+
 
 class TestIsShortcutKey:
     """Tests for _is_shortcut_key method."""
@@ -583,6 +604,94 @@ class TestSaveShortcut:
 
             assert result is False
 
+    def test_save_shortcuts_batch_uses_delayed_apply(self) -> None:
+        """Test batch save commits each schema once via delay()/apply()."""
+        from dailydriver.models import KeyBinding, Shortcut
+        from dailydriver.services.gsettings_service import GSettingsService
+
+        with patch("dailydriver.services.backends.gnome.Gio") as mock_gio:
+            mock_source = MagicMock()
+            mock_schema = MagicMock()
+            mock_key = MagicMock()
+            mock_variant_type = MagicMock()
+            mock_variant_type.dup_string.return_value = "as"
+            mock_key.get_value_type.return_value = mock_variant_type
+            mock_schema.get_key.return_value = mock_key
+            mock_source.lookup.return_value = mock_schema
+            mock_gio.SettingsSchemaSource.get_default.return_value = mock_source
+
+            mock_settings = MagicMock()
+            mock_gio.Settings.new_full.return_value = mock_settings
+
+            service = GSettingsService()
+
+            shortcuts = [
+                Shortcut(
+                    id=f"org.gnome.test.key-{i}",
+                    name="Test",
+                    description="",
+                    category="test",
+                    schema="org.gnome.test",
+                    key=f"key-{i}",
+                    bindings=[KeyBinding.from_accelerator("<Super>t")],
+                )
+                for i in range(3)
+            ]
+
+            saved = service.save_shortcuts_batch(shortcuts)
+
+            assert saved == shortcuts
+            assert mock_settings.set_value.call_count == 3
+            mock_settings.delay.assert_called_once()
+            mock_settings.apply.assert_called_once()
+
+    def test_save_shortcut_after_batch_writes_immediately(self) -> None:
+        """Test a batch doesn't leave the cached Settings in delay-apply mode."""
+        from dailydriver.models import KeyBinding, Shortcut
+        from dailydriver.services.gsettings_service import GSettingsService
+
+        with patch("dailydriver.services.backends.gnome.Gio") as mock_gio:
+            mock_source = MagicMock()
+            mock_schema = MagicMock()
+            mock_key = MagicMock()
+            mock_variant_type = MagicMock()
+            mock_variant_type.dup_string.return_value = "as"
+            mock_key.get_value_type.return_value = mock_variant_type
+            mock_schema.get_key.return_value = mock_key
+            mock_source.lookup.return_value = mock_schema
+            mock_gio.SettingsSchemaSource.get_default.return_value = mock_source
+
+            created: list[MagicMock] = []
+
+            def new_settings(*args: object) -> MagicMock:
+                settings = MagicMock()
+                created.append(settings)
+                return settings
+
+            mock_gio.Settings.new_full.side_effect = new_settings
+
+            service = GSettingsService()
+            shortcut = Shortcut(
+                id="org.gnome.test.key",
+                name="Test",
+                description="",
+                category="test",
+                schema="org.gnome.test",
+                key="key",
+                bindings=[KeyBinding.from_accelerator("<Super>t")],
+            )
+
+            service.save_shortcuts_batch([shortcut])
+            assert service.save_shortcut(shortcut)
+
+            batch, cached = created
+            batch.delay.assert_called_once()
+            batch.apply.assert_called_once()
+            batch.set_value.assert_called_once()
+            # The follow-up write went through Settings that was never delayed
+            cached.delay.assert_not_called()
+            cached.set_value.assert_called_once()
+
 
 class TestFindConflicts:
     """Tests for find_conflicts method."""
@@ -835,6 +944,30 @@ class TestCustomKeybindingOperations:
             # Should use custom2
             assert "custom2" in path
 
+    def test_add_custom_keybinding_writes_one_change_set(self) -> None:
+        """Test that a new binding's keys are committed together via delay()/apply()."""
+        from dailydriver.services.gsettings_service import GSettingsService
+
+        with patch("dailydriver.services.backends.gnome.Gio") as mock_gio:
+            mock_source = MagicMock()
+            mock_source.lookup.return_value = MagicMock()
+            mock_gio.SettingsSchemaSource.get_default.return_value = mock_source
+
+            mock_main_settings = MagicMock()
+            mock_main_settings.get_strv.return_value = []
+            mock_binding_settings = MagicMock()
+            mock_gio.Settings.new_full.side_effect = [mock_main_settings, mock_binding_settings]
+
+            service = GSettingsService()
+            path = service.add_custom_keybinding("Browser", "firefox", "<Super>b")
+
+            assert path is not None
+            mock_binding_settings.delay.assert_called_once()
+            assert mock_binding_settings.set_string.call_count == 3
+            mock_binding_settings.apply.assert_called_once()
+            mock_main_settings.delay.assert_not_called()
+            mock_main_settings.set_strv.assert_called_once_with("custom-keybindings", [path])
+
     def test_update_custom_keybinding(self) -> None:
         """Test updating a custom keybinding."""
         from dailydriver.services.gsettings_service import GSettingsService
@@ -1200,6 +1333,26 @@ class TestAppDetection:
 
             assert dd == "dailydriver --cheat-sheet"
 
+    def testdetect_skips_missing_flatpak(self) -> None:
+        """Test that a missing flatpak binary is only exec'd once."""
+        from dailydriver.services.gsettings_service import GSettingsService
+
+        with (
+            patch("dailydriver.services.backends.gnome.Gio") as mock_gio,
+            patch("subprocess.run") as mock_run,
+            patch("shutil.which") as mock_which,
+        ):
+            mock_source = MagicMock()
+            mock_gio.SettingsSchemaSource.get_default.return_value = mock_source
+            mock_run.side_effect = FileNotFoundError
+            mock_which.return_value = None
+
+            service = GSettingsService()
+            assert service.detect_music_player() is None
+            assert service.detect_dailydriver() is None
+
+            assert mock_run.call_count == 1
+
 
 class TestSetupDefaultCustomShortcuts:
     """Tests for setup_default_custom_shortcuts method."""
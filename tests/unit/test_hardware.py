@@ -167,6 +167,22 @@ class TestHardwareService:
         assert len(keyboards) == 1
         assert keyboards[0].is_bluetooth
 
+    def test_bluetooth_detection_without_bustype(self, mock_sysfs: Path) -> None:
+        """Test falling back to uevent when id/bustype is missing."""
+        from dailydriver.services.hardware_service import HardwareService
+
+        event_dir = create_mock_keyboard(
+            mock_sysfs, event_num=0, name="BT Keyboard", is_bluetooth=True
+        )
+        (event_dir / "device" / "id" / "bustype").unlink()
+
+        service = HardwareService()
+        service._input_path = mock_sysfs / "class" / "input"
+
+        keyboards = list(service.list_keyboards())
+
+        assert keyboards[0].is_bluetooth
+
     def test_internal_keyboard_detection(self, mock_sysfs: Path) -> None:
         """Test internal/laptop keyboard detection."""
         from dailydriver.services.hardware_service import HardwareService
@@ -220,6 +236,54 @@ class TestHardwareService:
         assert len(mac_keyboards) == 1
         assert mac_keyboards[0].is_mac
 
+    def test_get_keyboard_by_path(self, mock_sysfs: Path) -> None:
+        """Test looking up a detected keyboard by device path."""
+        from dailydriver.services.hardware_service import HardwareService
+
+        create_mock_keyboard(mock_sysfs, event_num=3, name="USB Keyboard")
+
+        service = HardwareService()
+        service._input_path = mock_sysfs / "class" / "input"
+
+        kb = service.get_keyboard_by_path("/dev/input/event3")
+
+        assert kb is not None
+        assert kb.name == "USB Keyboard"
+        assert service.get_keyboard_by_path("/dev/input/event9") is None
+
+    def test_invalidate_picks_up_hotplugged_keyboard(self, mock_sysfs: Path) -> None:
+        """Test that lookups use the last scan until it is invalidated."""
+        from dailydriver.services.hardware_service import HardwareService
+
+        service = HardwareService()
+        service._input_path = mock_sysfs / "class" / "input"
+
+        assert service.get_keyboard_by_path("/dev/input/event4") is None
+
+        create_mock_keyboard(mock_sysfs, event_num=4, name="USB Keyboard")
+        assert service.get_keyboard_by_path("/dev/input/event4") is None
+
+        service.invalidate()
+        assert service.get_keyboard_by_path("/dev/input/event4") is not None
+
+    def test_list_keyboards_reuses_last_scan(self, mock_sysfs: Path) -> None:
+        """Test that list_keyboards reuses the last scan until it is invalidated."""
+        from dailydriver.services.hardware_service import HardwareService
+
+        create_mock_keyboard(mock_sysfs, event_num=0, name="USB Keyboard")
+
+        service = HardwareService()
+        service._input_path = mock_sysfs / "class" / "input"
+
+        with patch.object(service, "scan", wraps=service.scan) as mock_scan:
+            assert len(list(service.list_keyboards())) == 1
+            assert len(list(service.list_keyboards())) == 1
+            assert mock_scan.call_count == 1
+
+            service.invalidate()
+            list(service.list_keyboards())
+            assert mock_scan.call_count == 2
+
     def test_model_name_for_known_product(self, mock_sysfs: Path) -> None:
         """Test model name detection for known Apple products."""
         from dailydriver.services.hardware_service import HardwareService
@@ -293,3 +357,49 @@ class TestHardwareService:
             keyboards = list(service.list_keyboards())
             # Should gracefully handle the error
             assert len(keyboards) == 0
+
+    def test_numpad_and_media_detection(self, mock_sysfs: Path) -> None:
+        """Test numpad/media detection from capability bit ranges."""
+        from dailydriver.services.hardware_service import _BITS_PER_LONG, HardwareService
+
+        # KEY_ESC..KEY_KPDOT (1-83) plus KEY_MUTE/VOLUMEDOWN/VOLUMEUP (113-115)
+        bits = sum(1 << code for code in range(1, 84)) | (0b111 << 113)
+        mask = (1 << _BITS_PER_LONG) - 1
+        words = []
+        while bits:
+            words.append(f"{bits & mask:x}")
+            bits >>= _BITS_PER_LONG
+        create_mock_keyboard(
+            mock_sysfs,
+            event_num=0,
+            name="USB Keyboard",
+            key_capabilities=" ".join(["0", "0", *reversed(words)]),
+        )
+
+        service = HardwareService()
+        service._input_path = mock_sysfs / "class" / "input"
+
+        keyboards = list(service.list_keyboards())
+
+        assert len(keyboards) == 1
+        assert keyboards[0].has_numpad
+        assert keyboards[0].has_media_keys
+
+    def test_scan_reads_each_attribute_once(self, mock_sysfs: Path) -> None:
+        """Test that scanning reads a device's name and key bitmap only once."""
+        from dailydriver.services import hardware_service
+        from dailydriver.services.hardware_service import HardwareService
+
+        create_mock_keyboard(mock_sysfs, event_num=0, name="USB Keyboard")
+
+        service = HardwareService()
+        service._input_path = mock_sysfs / "class" / "input"
+
+        with patch.object(
+            hardware_service, "_read_sysfs", wraps=hardware_service._read_sysfs
+        ) as mock_read:
+            assert len(service.scan()) == 1
+
+        paths = [call.args[0] for call in mock_read.call_args_list]
+        assert sum(p.endswith("/name") for p in paths) == 1
+        assert sum(p.endswith("/capabilities/key") for p in paths) == 1
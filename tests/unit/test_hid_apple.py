@@ -49,6 +49,16 @@ class TestHidAppleService:
             mock_run.return_value = MagicMock(returncode=0)
             assert service.is_available()
 
+    def test_is_available_when_built_in(self, tmp_path: Path) -> None:
+        """Test module availability when built in (sysfs dir without params)."""
+        from dailydriver.services.hid_apple_service import HidAppleService
+
+        service = HidAppleService()
+        service.MODULE_SYSFS_PATH = tmp_path
+        service.MODULE_PARAMS_PATH = tmp_path / "parameters"
+
+        assert service.is_available()
+
     def test_is_available_not_installed(self, tmp_path: Path) -> None:
         """Test module unavailable when not installed."""
         from dailydriver.services.hid_apple_service import HidAppleService
@@ -167,6 +167,30 @@ class TestKeyboardLayout:
         no_key = layout.get_key_at(10.0, 10.0)
         assert no_key is None
 
+    def test_get_key_at_off_grid_keys(self) -> None:
+        """Test hit testing keys that straddle or split grid cells."""
+        from dailydriver.models.keyboard import Key, KeyboardLayout, KeyboardType
+
+        layout = KeyboardLayout(
+            id="test",
+            name="Test",
+            type=KeyboardType.ANSI_87,
+            keys=[
+                Key(x=0.0, y=1.5, width=1.5, label="Tab"),
+                Key(x=1.5, y=1.5, label="Q"),
+                Key(x=3.0, y=0.0, height=0.5, label="Up"),
+                Key(x=3.0, y=0.5, height=0.5, label="Down"),
+            ],
+        )
+
+        assert layout.get_key_at(1.2, 2.2).label == "Tab"
+        assert layout.get_key_at(1.6, 1.9).label == "Q"
+        assert layout.get_key_at(3.5, 0.2).label == "Up"
+        assert layout.get_key_at(3.5, 0.7).label == "Down"
+        assert layout.get_key_at(2.6, 2.0) is None
+        assert layout.get_key_at(0.5, 1.2) is None
+        assert layout.get_key_at(-0.5, -0.5) is None
+
     def test_get_key_by_keycode(self, tmp_path: Path) -> None:
         """Test finding key by keycode."""
         from dailydriver.models.keyboard import KeyboardLayout
@@ -539,6 +563,22 @@ class TestProfile:
         profile.set_shortcut("org.gnome.desktop.wm.keybindings", "close", ["<Super>q"])
         assert profile.get_shortcut("org.gnome.desktop.wm.keybindings", "close") == ["<Super>q"]
 
+    def test_normalized_shortcuts_cached_and_invalidated(self, mock_gi: dict) -> None:
+        """Test normalized shortcuts are cached until set_shortcut is called."""
+        from dailydriver.models.profile import Profile
+
+        profile = Profile(name="test")
+        profile.set_shortcut("org.gnome.desktop.wm.keybindings", "close", ["<Alt>F4"])
+
+        first = profile.normalized_shortcuts()
+        assert "org.gnome.desktop.wm.keybindings.close" in first
+        assert profile.normalized_shortcuts() is first
+
+        profile.set_shortcut("org.gnome.desktop.wm.keybindings", "minimize", ["<Super>h"])
+        updated = profile.normalized_shortcuts()
+        assert updated is not first
+        assert "org.gnome.desktop.wm.keybindings.minimize" in updated
+
 
 class TestPresetValidity:
     """Tests to ensure all preset files are valid."""
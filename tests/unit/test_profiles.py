@@ -137,6 +137,57 @@ class TestProfileService:
 
             assert result is None
 
+    def test_get_profile_cached_until_modified(self, tmp_path: Path) -> None:
+        """Test that parsed profiles are reused until the file changes."""
+        from dailydriver.models.profile import Profile
+        from dailydriver.services.profile_service import ProfileService
+
+        profiles_dir = tmp_path / "profiles"
+        profiles_dir.mkdir(parents=True)
+
+        profile = Profile(name="my-profile", description="Test")
+        profile.to_toml(profiles_dir / "my-profile.toml")
+
+        with patch("dailydriver.services.profile_service.GLib") as mock_glib:
+            mock_glib.get_user_config_dir.return_value = str(tmp_path / "config")
+            mock_glib.get_system_data_dirs.return_value = []
+
+            service = ProfileService(gsettings_service=MagicMock())
+            service._profiles_dir = profiles_dir
+            service._presets_dir = tmp_path / "presets"
+
+            first = service.get_profile("my-profile")
+            assert service.get_profile("my-profile") is first
+
+            profile.description = "Changed description"
+            profile.to_toml(profiles_dir / "my-profile.toml")
+
+            updated = service.get_profile("my-profile")
+            assert updated is not first
+            assert updated.description == "Changed description"
+
+    def test_list_profiles_skips_invalid_without_reparsing(self, tmp_path: Path) -> None:
+        """Test that an unchanged invalid profile is parsed only once."""
+        from dailydriver.models.profile import Profile
+        from dailydriver.services.profile_service import ProfileService
+
+        profiles_dir = tmp_path / "profiles"
+        profiles_dir.mkdir(parents=True)
+        (profiles_dir / "broken.toml").write_text("not = [valid toml")
+
+        with patch("dailydriver.services.profile_service.GLib") as mock_glib:
+            mock_glib.get_user_config_dir.return_value = str(tmp_path / "config")
+            mock_glib.get_system_data_dirs.return_value = []
+
+            service = ProfileService(gsettings_service=MagicMock())
+            service._profiles_dir = profiles_dir
+            service._presets_dir = tmp_path / "presets"
+
+            with patch.object(Profile, "from_toml", wraps=Profile.from_toml) as mock_from_toml:
+                assert list(service.list_profiles()) == []
+                assert list(service.list_profiles()) == []
+                assert mock_from_toml.call_count == 1
+
     def test_save_profile(self, tmp_path: Path) -> None:
         """Test saving a profile."""
         from dailydriver.models.profile import Profile
@@ -325,6 +376,47 @@ class TestProfileService:
             # The minimize shortcut was in old but not in new
             assert count >= 0  # May be 0 or 1 depending on is_modified state
 
+    def test_clean_slate_skips_profile_shortcuts(self, tmp_path: Path, mock_gi: dict) -> None:
+        """Test clean slate only clears shortcuts the profile doesn't define."""
+        from dailydriver.models.profile import Profile
+        from dailydriver.models.shortcut import KeyBinding, Shortcut
+        from dailydriver.services.profile_service import ProfileService
+
+        profile = Profile(name="preset", metadata={"preset": True})
+        profile.set_shortcut("org.gnome.desktop.wm.keybindings", "close", ["<Super>q"])
+
+        def make_shortcut(key: str, accel: str) -> Shortcut:
+            binding = KeyBinding.from_accelerator(accel)
+            return Shortcut(
+                id=f"org.gnome.desktop.wm.keybindings.{key}",
+                name=key,
+                description="",
+                category="window-management",
+                schema="org.gnome.desktop.wm.keybindings",
+                key=key,
+                bindings=[binding] if binding else [],
+            )
+
+        close = make_shortcut("close", "<Super>q")
+        minimize = make_shortcut("minimize", "<Super>h")
+
+        mock_gsettings = MagicMock()
+        mock_gsettings.save_shortcuts_batch.side_effect = lambda shortcuts: shortcuts
+
+        with patch("dailydriver.services.profile_service.GLib") as mock_glib:
+            mock_glib.get_user_config_dir.return_value = str(tmp_path / "config")
+            mock_glib.get_system_data_dirs.return_value = []
+
+            service = ProfileService(gsettings_service=mock_gsettings)
+            changed = service.apply_profile(
+                profile, current_shortcuts={close.id: close, minimize.id: minimize}
+            )
+
+            # close already matches the preset, so it is neither cleared nor rewritten
+            assert list(changed) == [minimize.id]
+            assert minimize.bindings == []
+            assert close.accelerators == ["<Super>q"]
+
 
 class TestProfileDiff:
     """Tests for profile diff functionality."""
@@ -413,6 +505,19 @@ class TestProfileDiff:
             # Should show the difference
             assert "org.gnome.desktop.wm.keybindings.close" in diff
 
+    def test_accels_differ(self) -> None:
+        """Test order-insensitive accelerator comparison and its shortcuts."""
+        from dailydriver.services.profile_service import _accels_differ
+
+        assert not _accels_differ([], frozenset())
+        assert _accels_differ([], frozenset({"<Super>q"}))
+        assert not _accels_differ(["<Super>q"], frozenset({"<Super>q"}))
+        assert _accels_differ(["<Super>w"], frozenset({"<Super>q"}))
+        assert _accels_differ(["<Super>q"], frozenset())
+        assert not _accels_differ(["<Alt>F4", "<Super>q"], frozenset({"<Super>q", "<Alt>F4"}))
+        # Duplicates still compare as a set
+        assert not _accels_differ(["<Super>q", "<Super>q"], frozenset({"<Super>q"}))
+
 
 class TestUserModifications:
     """Tests for user modifications tracking."""
@@ -440,3 +545,27 @@ class TestUserModifications:
 
             # No modifications, should return None
             assert result is None
+
+    def test_export_and_clear_no_modifications(self, tmp_path: Path, presets_dir: Path) -> None:
+        """Test exporting when nothing differs loads shortcuts once and writes nothing."""
+        from dailydriver.services.profile_service import ProfileService
+
+        profiles_dir = tmp_path / "profiles"
+        profiles_dir.mkdir(parents=True)
+
+        mock_gsettings = MagicMock()
+        mock_gsettings.load_all_shortcuts.return_value = {}
+
+        with patch("dailydriver.services.profile_service.GLib") as mock_glib:
+            mock_glib.get_user_config_dir.return_value = str(tmp_path / "config")
+            mock_glib.get_system_data_dirs.return_value = []
+
+            service = ProfileService(gsettings_service=mock_gsettings)
+            service._profiles_dir = profiles_dir
+            service._presets_dir = presets_dir
+
+            assert service.export_and_clear_modifications("vanilla-gnome") == (None, 0)
+            assert service.export_and_clear_modifications("missing-preset") == (None, 0)
+
+            assert mock_gsettings.load_all_shortcuts.call_count == 1
+            assert list(profiles_dir.iterdir()) == []